@@ -1,6 +1,7 @@
 """Build a static dashboard from results files focused on residential spending.
 
-Outputs a standalone HTML at `site/index.html` showing:
+Outputs `site/index.html` with the `site/data.json` and `site/style.css` it
+loads, showing:
 - Residential spending at hourly, daily, weekly, monthly, yearly levels
 - Peak spending period analysis to help users focus on cost reduction
 - Actionable insights and recommendations
@@ -8,13 +9,19 @@ Outputs a standalone HTML at `site/index.html` showing:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import hashlib
 import json
+import os
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[1]
 RESULTS_DIR = ROOT / "results"
@@ -24,1785 +31,2104 @@ FEATURES_DIR = ROOT / "features"
 # California has approximately 13 million households (2020-2024 estimate)
 CA_HOUSEHOLDS = 13_000_000
 
+# Columns needed from each features/hourly_price monthly file
+HOURLY_PRICE_COLUMNS = ["Date", "HE", "Estimated_Hourly_Cost_USD"]
+
+# Decimal places kept for cost values in data.json. Two or more places finer
+# than the page's display precision (4 for hourly, 2 otherwise), and it keeps
+# float noise digits out of the payload
+VAL_DECIMALS = 6
+
+# Full month names indexed by month number - 1, for lookups by integer month
+MONTH_NAMES = np.array(
+    ["January", "February", "March", "April", "May", "June", "July",
+     "August", "September", "October", "November", "December"], dtype=object)
+
+# Columns needed from the (much wider) daily/monthly history results
+DAILY_HISTORY_COLUMNS = ["date", "Estimated_Hourly_Cost_USD"]
+MONTHLY_HISTORY_COLUMNS = ["year_month_start", "Estimated_Hourly_Cost_USD"]
+
+
+# Page styles, written to site/style.css so the browser can cache them
+# separately from the page. The content hash in the URL busts stale copies.
+_PAGE_CSS = "\n".join([
+    "body { font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; background: #f8f9fa; padding-top: 56px; }",
+    ".navbar { z-index: 1030; margin-bottom: 0 !important; width: 100%; }",
+    ".sidebar { background-color: #212529; color: #e5e7eb; min-height: calc(100vh - 56px); padding: 1rem; position: fixed; left: 0; top: 56px; z-index: 1020; transition: transform 0.3s ease, margin-left 0.3s ease; width: 250px; border-top: 1px solid rgba(255,255,255,0.1); }",
+    ".sidebar h6 { font-size: 0.75rem; letter-spacing: .08em; text-transform: uppercase; color: #9ca3af; margin-bottom: 1rem; }",
+    ".sidebar .form-label { font-size: 0.8rem; color: #d1d5db; margin-bottom: 0.5rem; }",
+    ".sidebar .form-select, .sidebar .form-control { background-color: #343a40; border-color: #495057; color: #e5e7eb; }",
+    ".sidebar .form-select:focus, .sidebar .form-control:focus { background-color: #343a40; border-color: #6c757d; color: #e5e7eb; }",
+    ".stat-card { background: white; border-radius: 8px; padding: 1rem; box-shadow: 0 1px 3px rgba(0,0,0,0.1); }",
+    ".sidebar.hidden { transform: translateX(-250px); }",
+    ".hamburger-btn { background: none; border: none; color: white; font-size: 1.5rem; padding: 0.5rem; cursor: pointer; margin-right: 0.5rem; }",
+    ".hamburger-btn:hover { opacity: 0.8; }",
+    ".sidebar-overlay { display: none; position: fixed; top: 56px; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 999; }",
+    ".sidebar-overlay.show { display: block; }",
+    "@media (min-width: 768px) { .sidebar-overlay { display: none !important; } }",
+    "@media (min-width: 768px) { .sidebar { position: fixed; transform: none; } .sidebar.hidden { transform: translateX(-250px); } }",
+    "main { transition: margin-left 0.3s ease; margin-left: 250px; }",
+    "main.full-width { margin-left: 0; }",
+    "@media (max-width: 767px) { main { margin-left: 0; } }",
+    ".sidebar .nav-link { color: #d1d5db; padding: 0.5rem 1rem; border-radius: 4px; margin-bottom: 0.25rem; font-size: 0.9rem; border: 1px solid transparent; transition: all 0.2s; cursor: pointer; }",
+    ".sidebar .nav-link:hover { background-color: #343a40; color: white; }",
+    ".sidebar .nav-link.active { background-color: #3b82f6; color: white; border-color: #3b82f6; }",
+    ".sidebar .nav-link i { margin-right: 0.5rem; }",
+    ".section-hidden { display: none; }",
+    ".about-content { line-height: 1.7; color: #374151; }",
+    ".about-content h2 { color: #111827; margin-top: 1.5rem; }",
+    ".about-content p { margin-bottom: 1.25rem; }",
+    ".sub-header { border-left: 4px solid #3b82f6; padding-left: 0.75rem; margin-bottom: 1.5rem; font-weight: 600; color: #1f2937; }",
+    "th.sortable { cursor: pointer; position: relative; padding-right: 1.5rem !important; }",
+    "th.sortable::after { content: '↕'; position: absolute; right: 0.5rem; opacity: 0.3; }",
+    "th.sortable.asc::after { content: '↑'; opacity: 1; color: #3b82f6; }",
+    "th.sortable.desc::after { content: '↓'; opacity: 1; color: #3b82f6; }",
+    ".pagination-controls { display: flex; justify-content: space-between; align-items: center; margin-top: 1rem; flex-wrap: wrap; gap: 0.5rem; }",
+    ".btn:disabled, .btn.disabled { opacity: 0.5; cursor: not-allowed; pointer-events: none; }",
+    ".flatpickr-day.disabled, .flatpickr-day.not-allowed { opacity: 0.3; cursor: not-allowed; }",
+    ".flatpickr-day.disabled:hover, .flatpickr-day.not-allowed:hover { background: transparent; }",
+    ".chatbot-container { position: fixed; bottom: 20px; right: 20px; width: 380px; max-height: 600px; z-index: 1000; box-shadow: 0 4px 12px rgba(0,0,0,0.15); border-radius: 12px; overflow: hidden; background: white; display: none; }",
+    ".chatbot-container.open { display: flex; flex-direction: column; }",
+    ".chatbot-header { background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); color: white; padding: 1rem; display: flex; justify-content: space-between; align-items: center; cursor: pointer; }",
+    ".chatbot-header h6 { margin: 0; font-weight: 600; }",
+    ".chatbot-body { flex: 1; overflow-y: auto; padding: 1rem; background: #f8f9fa; max-height: 450px; }",
+    ".chatbot-message { margin-bottom: 1rem; padding: 0.75rem; border-radius: 8px; }",
+    ".chatbot-message.user { background: #e3f2fd; margin-left: 2rem; }",
+    ".chatbot-message.assistant { background: white; margin-right: 2rem; border-left: 3px solid #3b82f6; }",
+    ".chatbot-input-container { padding: 1rem; background: white; border-top: 1px solid #e5e7eb; display: flex; gap: 0.5rem; }",
+    ".chatbot-input { flex: 1; border: 1px solid #d1d5db; border-radius: 6px; padding: 0.5rem; font-size: 0.9rem; }",
+    ".chatbot-toggle { position: fixed; bottom: 20px; right: 20px; width: 60px; height: 60px; border-radius: 50%; background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); color: white; border: none; box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4); cursor: pointer; z-index: 999; display: flex; align-items: center; justify-content: center; font-size: 1.5rem; transition: transform 0.2s; }",
+    ".chatbot-toggle:hover { transform: scale(1.1); }",
+    ".chatbot-toggle.hidden { display: none; }",
+    ".recommendation-badge { display: inline-block; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; font-weight: 600; margin-left: 0.5rem; }",
+    ".recommendation-badge.best { background: #10b981; color: white; }",
+    ".recommendation-badge.good { background: #3b82f6; color: white; }",
+    ".recommendation-badge.avoid { background: #ef4444; color: white; }",
+    "",
+])
+_PAGE_CSS_URL = (
+    f"style.css?v={hashlib.md5(_PAGE_CSS.encode('utf-8')).hexdigest()[:12]}")
+
+# Static page shell (head, navigation and dashboard markup), joined once at
+# import instead of on every build() call
+_PAGE_HEAD = "\n".join([
+    "<html>",
+    "<head>",
+    "<title>California Residential Energy Spending: History & Predictions</title>",
+    "<link rel='preconnect' href='https://cdn.plot.ly'>",
+    "<link rel='preconnect' href='https://cdn.jsdelivr.net'>",
+    "<link rel='stylesheet' href='https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css'>",
+    "<link rel='stylesheet' href='https://cdn.jsdelivr.net/npm/flatpickr/dist/flatpickr.min.css'>",
+    # Deferred so parsing isn't blocked; only line charts are drawn, so the
+    # pinned basic bundle is enough
+    "<script defer src='https://cdn.plot.ly/plotly-basic-2.27.0.min.js'></script>",
+    "<script defer src='https://cdn.jsdelivr.net/npm/flatpickr'></script>",
+    f"<link rel='stylesheet' href='{_PAGE_CSS_URL}'>",
+    "</head>",
+    "<body>",
+    "<nav class='navbar navbar-dark bg-dark px-3 fixed-top'>",
+    "<button class='hamburger-btn' id='sidebar-toggle' aria-label='Toggle menu'>☰</button>",
+    "<span class='navbar-brand ms-2'>California Residential Energy Spending</span>",
+    "</nav>",
+    "<div class='sidebar-overlay' id='sidebar-overlay'></div>",
+    "<div class='container-fluid'>",
+    "<div class='row'>",
+    "<aside class='col-md-3 col-lg-2 sidebar' id='sidebar'>",
+    "<div class='mb-4'>",
+    "<h6>Navigation</h6>",
+    "<div class='nav flex-column'>",
+    "<div class='nav-link active' id='nav-dashboard'>Dashboard</div>",
+    "<div class='nav-link' id='nav-evaluations'>Evaluations</div>",
+    "<div class='nav-link' id='nav-about'>About</div>",
+    "</div>",
+    "</div>",
+    "<div id='sidebar-filters'>",
+    "<h6>Time Filtering</h6>",
+    "<div class='mb-3'>",
+    "<label for='granularity' class='form-label'>View</label>",
+    "<select id='granularity' class='form-select form-select-sm'>",
+    "<option value='hourly'>Hourly</option>",
+    "<option value='daily'>Daily</option>",
+    "<option value='weekly'>Weekly</option>",
+    "<option value='monthly' selected>Monthly</option>",
+    "</select>",
+    "</div>",
+    "<div class='mb-3'>",
+    "<label for='date-range' class='form-label'>Date Range</label>",
+    "<div class='input-group input-group-sm'>",
+    "<input type='text' id='date-range' class='form-control form-control-sm' placeholder='Select range...'>",
+    "<button type='button' id='today-btn' class='btn btn-outline-primary btn-sm' title='Go to current period'>Today</button>",
+    "</div>",
+    "</div>",
+    "<div class='mb-3' id='period-navigation' style='display:none;'>",
+    "<label for='period-select' class='form-label' id='period-label'>Navigate to</label>",
+    "<select id='period-select' class='form-select form-select-sm'>",
+    "<option value=''>Select period...</option>",
+    "</select>",
+    "</div>",
+    "</div>",
+    "</aside>",
+    "<main class='col-md-9 col-lg-10 py-3'>",
+    "<div id='section-dashboard'>",
+    "    <div class='card mb-3'>",
+    "        <div class='card-header fw-semibold text-primary d-flex justify-content-between align-items-center'>",
+    "            <span>Visual Trends</span>",
+    "            <div class='btn-group btn-group-sm' role='group'>",
+    "                <button type='button' class='btn btn-outline-primary' id='chart-prev-btn' title='Previous period'>",
+    "                    <svg xmlns='http://www.w3.org/2000/svg' width='16' height='16' fill='currentColor' class='bi bi-chevron-left' viewBox='0 0 16 16'><path fill-rule='evenodd' d='M11.354 1.646a.5.5 0 0 1 0 .708L5.707 8l5.647 5.646a.5.5 0 0 1-.708.708l-6-6a.5.5 0 0 1 0-.708l6-6a.5.5 0 0 1 .708 0z'/></svg>",
+    "                </button>",
+    "                <button type='button' class='btn btn-outline-primary' id='chart-next-btn' title='Next period'>",
+    "                    <svg xmlns='http://www.w3.org/2000/svg' width='16' height='16' fill='currentColor' class='bi bi-chevron-right' viewBox='0 0 16 16'><path fill-rule='evenodd' d='M4.646 1.646a.5.5 0 0 1 .708 0l6 6a.5.5 0 0 1 0 .708l-6 6a.5.5 0 0 1-.708-.708L10.293 8 4.646 2.354a.5.5 0 0 1 0-.708z'/></svg>",
+    "                </button>",
+    "            </div>",
+    "        </div>",
+    "        <div class='card-body'>",
+    "            <div id='energy-chart-container' class='mb-4'></div>",
+    "        </div>",
+    "    </div>",
+    "    <div class='card mb-3'>",
+    "        <div class='card-header fw-semibold text-primary'>Detailed Data Breakdown</div>",
+    "        <div class='card-body'>",
+    "            <div class='row g-3 mb-3'>",
+    "                <div class='col-auto'>",
+    "                    <label class='form-label small fw-bold text-muted mb-1'>Filter by Type</label>",
+    "                    <select id='table-type-filter' class='form-select form-select-sm' style='width: 150px;'>",
+    "                        <option value='all'>All Types</option>",
+    "                        <option value='historical'>Historical</option>",
+    "                        <option value='prediction'>Prediction</option>",
+    "                    </select>",
+    "                </div>",
+    "                <div class='col-auto ms-auto d-flex align-items-end'>",
+    "                    <label class='form-label small fw-bold text-muted me-2 mb-2'>Show</label>",
+    "                    <select id='table-page-size' class='form-select form-select-sm' style='width: 70px;'>",
+    "                        <option value='10'>10</option>",
+    "                        <option value='25'>25</option>",
+    "                        <option value='50'>50</option>",
+    "                    </select>",
+    "                </div>",
+    "            </div>",
+    "            <div class='table-responsive'>",
+    "                <table id='energy-table' class='table table-sm table-hover table-striped mb-0'>",
+    "                    <thead>",
+    "                        <tr>",
+    "                            <th>Type</th>",
+    "                            <th class='sortable' data-sort='val' id='sort-cost'>Cost</th>",
+    "                            <th class='sortable date-col' data-sort='year' id='col-year' style='display:none;'>Year</th>",
+    "                            <th class='sortable date-col' data-sort='month' id='col-month' style='display:none;'>Month</th>",
+    "                            <th class='sortable date-col' data-sort='day' id='col-day' style='display:none;'>Day</th>",
+    "                            <th class='sortable date-col' data-sort='hour' id='col-hour' style='display:none;'>Hour</th>",
+    "                        </tr>",
+    "                    </thead>",
+    "                    <tbody id='energy-table-body'></tbody>",
+    "                </table>",
+    "            </div>",
+    "            <div class='pagination-controls'>",
+    "                <div class='small text-muted' id='pagination-info'>Showing 1 to 10 of 0 entries</div>",
+    "                <nav aria-label='Table navigation'>",
+    "                    <ul class='pagination pagination-sm mb-0' id='pagination-list'></ul>",
+    "                </nav>",
+    "            </div>",
+    "        </div>",
+    "    </div>",
+    "    <div class='card mb-3'>",
+    "        <div class='card-header fw-semibold text-primary'>Energy Usage Recommendations</div>",
+    "        <div class='card-body'>",
+    "            <div id='recommendations-container'></div>",
+    "        </div>",
+    "    </div>",
+    "</div>",
+])
+
+# Static About section
+_ABOUT_SECTION = """
+<div id='section-about' class='section-hidden'>
+    <div class='card mb-3'>
+        <div class='card-header fw-semibold text-primary'>About This Project</div>
+        <div class='card-body about-content'>
+            <h2 class="h4 mb-3">Motivation</h2>
+            <p>Southern California experiences some of the highest electricity demand in the United States due to a combination of factors such as widespread air-conditioning use, a growing number of electric vehicles, and increasing residential and commercial energy consumption. During hot summer months, cooling loads drive peak demand in the late afternoon and evening, while electric vehicle charging and household activities further elevate nighttime consumption. These demand patterns often lead to periods of high electricity prices, even when consumers are unaware of the cost differences throughout the day.</p>
+            
+            <p>At the same time, many energy-intensive activities—such as EV charging, running laundry, or operating large appliances—can be shifted to hours when electricity is cheaper. Identifying these “optimal usage windows” has the potential to reduce household energy bills, ease stress on the electric grid, and support more efficient use of renewable generation.</p>
+            
+            <p>However, hourly electricity prices are not always publicly available for Southern California, and consumers rarely have access to clear or actionable guidance about when electricity is most affordable. This project addresses this gap by estimating hourly electricity costs using available demand, generation, and weather data, and by forecasting prices for the next day. With these predictions, the system provides users with intuitive recommendations about the best times to use electricity.</p>
+            
+            <p>By helping consumers shift demand to lower-cost hours, the project supports both economic savings and grid reliability, while also encouraging more sustainable energy behavior in a region where electricity demand continues to rise.</p>
+        </div>
+    </div>
+</div>
+"""
 
-def _read_csv(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path) if path.exists() else pd.DataFrame()
+# Unified dashboard script (historical + predictions); DATA_URL is defined
+# by a small per-build script emitted just before it
+_DASHBOARD_SCRIPT = """
+<script>
+// Filled in from data.json by loadDashboardData()
+let dataByGranularity = { hourly: [], daily: [], weekly: [], monthly: [] };
+let allData = [];
+let validDates = []; // Sorted ascending by the build
+let validDateSet = new Set();
+let fp; 
 
+// Table State
+let tableState = {
+    data: [], // Currently filtered and windowed data
+    granularity: null, // Granularity tableState.data was built for
+    displayData: [], // After type filter and sort
+    typeFilter: 'all',
+    sortCol: 'date',
+    sortDir: 'desc',
+    pageSize: 10,
+    currentPage: 1
+};
+
+// Elements touched on every render, looked up once; the dashboard markup
+// precedes this script
+const granularitySelect = document.getElementById('granularity');
+const dateRangeInput = document.getElementById('date-range');
+const chartContainer = document.getElementById('energy-chart-container');
+const chartPrevBtn = document.getElementById('chart-prev-btn');
+const chartNextBtn = document.getElementById('chart-next-btn');
+const tableBody = document.getElementById('energy-table-body');
+const paginationInfo = document.getElementById('pagination-info');
+const paginationList = document.getElementById('pagination-list');
+const yearCol = document.getElementById('col-year');
+const monthCol = document.getElementById('col-month');
+const dayCol = document.getElementById('col-day');
+const hourCol = document.getElementById('col-hour');
+const periodNav = document.getElementById('period-navigation');
+const periodSelect = document.getElementById('period-select');
+const periodLabel = document.getElementById('period-label');
+
+// Selected granularity, tracked from the select's change events instead of
+// being read back from the DOM on every render
+let currentGranularity = granularitySelect?.value || 'monthly';
+const recommendationsContainer = document.getElementById('recommendations-container');
+
+// Row markup that only depends on the record type or the granularity
+const TYPE_BADGES = {
+    historical: '<span class="badge bg-secondary">Historical</span>',
+    prediction: '<span class="badge bg-primary">Prediction</span>'
+};
+const TABLE_DATE_FIELDS = {
+    hourly: ['year', 'month', 'day', 'hour'],
+    daily: ['year', 'month', 'day'],
+    weekly: ['year', 'month'],
+    monthly: ['year', 'month']
+};
+
+// Record dates within a granularity share one zero-padded ISO layout, so
+// comparing the strings orders them chronologically without parsing
+const byDate = (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0);
+
+// Index of the first row satisfying pred, for a pred that stays true once true
+function firstIndex(rows, pred) {
+    let lo = 0, hi = rows.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (pred(rows[mid])) hi = mid; else lo = mid + 1;
+    }
+    return lo;
+}
+
+// Coalesce bursts of view updates (rapid prev/next clicks, date and
+// granularity changes) into a single render per animation frame
+let viewUpdatePending = false;
+let chatbotAnalysisTimer = null;
+let lastViewKey = null; // granularity|date last rendered by renderView
+function updateView() {
+    if (viewUpdatePending) return;
+    viewUpdatePending = true;
+    requestAnimationFrame(() => {
+        viewUpdatePending = false;
+        renderView();
+    });
+}
+
+function renderView() {
+    if (!granularitySelect) return;
+    const granularity = currentGranularity;
+    const selectedDateStr = dateRangeInput.value || (fp ? fp.formatDate(fp.selectedDates[0], 'Y-m-d') : '');
+    
+    if (!selectedDateStr) return;
+    
+    // Nothing to redraw if the same view is already showing
+    const viewKey = granularity + '|' + selectedDateStr;
+    if (viewKey === lastViewKey) return;
+    lastViewKey = viewKey;
+    
+    const selectedDate = new Date(selectedDateStr + 'T00:00:00');
+    let start, end;
 
-def _format_evaluation_metrics(metrics: dict) -> str:
-    """Format evaluation metrics as HTML."""
-    if not metrics:
-        return ""
+    if (granularity === 'hourly') {
+        start = new Date(selectedDate);
+        end = new Date(selectedDate);
+        end.setHours(23, 59, 59);
+    } else if (granularity === 'daily') {
+        start = new Date(selectedDate);
+        const day = start.getDay();
+        const diff = start.getDate() - day + (day === 0 ? -6 : 1);
+        start.setDate(diff);
+        start.setHours(0,0,0,0);
+        end = new Date(start);
+        end.setDate(start.getDate() + 6);
+        end.setHours(23, 59, 59);
+    } else if (granularity === 'weekly') {
+        start = new Date(selectedDate.getFullYear(), selectedDate.getMonth(), 1);
+        end = new Date(selectedDate.getFullYear(), selectedDate.getMonth() + 1, 0);
+        end.setHours(23, 59, 59);
+    } else if (granularity === 'monthly') {
+        start = new Date(selectedDate.getFullYear(), 0, 1);
+        end = new Date(selectedDate.getFullYear(), 11, 31);
+        end.setHours(23, 59, 59);
+    }
 
-    html_parts = []
-    for granularity, metric_data in metrics.items():
-        html_parts.append(f"""
-        <div class='card mb-3'>
-            <div class='card-header fw-semibold'>{granularity.upper()} Model Metrics</div>
-            <div class='card-body'>
-                <div class='row g-3'>
-                    <div class='col-md-3'>
-                        <div class='stat-card'>
-                            <div class='small text-muted mb-1'>Mean Absolute Error</div>
-                            <div class='h5 mb-0'>${metric_data.get('mae', 0):.4f}</div>
-                        </div>
-                    </div>
-                    <div class='col-md-3'>
-                        <div class='stat-card'>
-                            <div class='small text-muted mb-1'>Root Mean Squared Error</div>
-                            <div class='h5 mb-0'>${metric_data.get('rmse', 0):.4f}</div>
-                        </div>
-                    </div>
-                    <div class='col-md-3'>
-                        <div class='stat-card'>
-                            <div class='small text-muted mb-1'>Mean Absolute % Error</div>
-                            <div class='h5 mb-0'>{metric_data.get('mape', 0):.2f}%</div>
-                        </div>
-                    </div>
-                    <div class='col-md-3'>
-                        <div class='stat-card'>
-                            <div class='small text-muted mb-1'>R² Score</div>
-                            <div class='h5 mb-0'>{metric_data.get('r2', 0):.4f}</div>
-                        </div>
-                    </div>
-                    <div class='col-md-6'>
-                        <div class='stat-card'>
-                            <div class='small text-muted mb-1'>Mean Actual Value</div>
-                            <div class='h5 mb-0'>${metric_data.get('mean_actual', 0):.2f}</div>
-                        </div>
-                    </div>
-                    <div class='col-md-6'>
-                        <div class='stat-card'>
-                            <div class='small text-muted mb-1'>Mean Predicted Value</div>
-                            <div class='h5 mb-0'>${metric_data.get('mean_predicted', 0):.2f}</div>
-                        </div>
-                    </div>
-                    <div class='col-12'>
-                        <div class='small text-muted'>
-                            <strong>Sample Size:</strong> {metric_data.get('n_samples', 0)} predictions
-                            <br><strong>Mean Error:</strong> ${metric_data.get('mean_error', 0):.2f}
-                            <br><strong>RMSE as % of Mean:</strong> {metric_data.get('rmse_percentage', 0):.2f}%
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        """)
+    // Chart still uses windowed data; buckets arrive sorted by date, so
+    // locate the window with two binary searches instead of a full scan
+    const rows = dataByGranularity[granularity] || [];
+    let lo, hi;
+    if (granularity === 'monthly') {
+        // For monthly, compare by year only
+        const year = selectedDate.getFullYear();
+        lo = firstIndex(rows, d => new Date(d.date).getFullYear() >= year);
+        hi = firstIndex(rows, d => new Date(d.date).getFullYear() > year);
+    } else {
+        lo = firstIndex(rows, d => new Date(d.date) >= start);
+        hi = firstIndex(rows, d => new Date(d.date) > end);
+    }
+    let chartData = rows.slice(lo, Math.max(lo, hi));
+    
+    // Remove predictions if historical data exists for the same month
+    if (granularity === 'monthly') {
+        const monthMap = new Map();
+        // First pass: identify which months have historical data
+        chartData.forEach(d => {
+            if (d.type === 'historical') {
+                const monthKey = d.date.substring(0, 7); // YYYY-MM
+                monthMap.set(monthKey, true);
+            }
+        });
+        // Second pass: filter out predictions for months that have historical data
+        chartData = chartData.filter(d => {
+            if (d.type === 'prediction') {
+                const monthKey = d.date.substring(0, 7); // YYYY-MM
+                return !monthMap.has(monthKey); // Remove prediction if historical exists
+            }
+            return true; // Keep all historical data
+        });
+    }
+    
+    // For monthly/yearly view: if only one month of data for the selected year,
+    // include the previous 2 months for context
+    if (granularity === 'monthly' && chartData.length > 0) {
+        const monthsInYear = chartData.filter(d => {
+            const dDate = new Date(d.date);
+            return dDate.getFullYear() === selectedDate.getFullYear();
+        });
+        
+        // Count unique months in the selected year
+        const uniqueMonths = new Set(monthsInYear.map(d => {
+            const dDate = new Date(d.date);
+            const year = dDate.getFullYear();
+            const month = dDate.getMonth() + 1;
+            const monthStr = month < 10 ? '0' + month : month.toString();
+            return year + '-' + monthStr;
+        }));
+        
+        // If only one month in the selected year, add previous 2 months
+        if (uniqueMonths.size === 1) {
+            const selectedYear = selectedDate.getFullYear();
+            const prevYear = selectedYear - 1;
+            
+            // Get previous 2 months (November and December of previous year)
+            const prevMonths = dataByGranularity.monthly.filter(d => {
+                const dDate = new Date(d.date);
+                const dYear = dDate.getFullYear();
+                const dMonth = dDate.getMonth() + 1; // 1-12
+                // Include November (11) and December (12) of previous year
+                return dYear === prevYear && (dMonth === 11 || dMonth === 12);
+            });
+            
+            // Combine previous months with current year data, sorted by date
+            chartData = [...prevMonths, ...chartData].sort(byDate);
+        }
+    }
+    
+    // Table shows all data for this granularity
+    // For monthly: remove predictions if historical exists for the same month
+    let tableData = dataByGranularity[granularity] || [];
+    if (granularity === 'monthly') {
+        const monthMap = new Map();
+        // First pass: identify which months have historical data
+        tableData.forEach(d => {
+            if (d.type === 'historical') {
+                const monthKey = d.date.substring(0, 7); // YYYY-MM
+                monthMap.set(monthKey, true);
+            }
+        });
+        // Second pass: filter out predictions for months that have historical data
+        tableData = tableData.filter(d => {
+            if (d.type === 'prediction') {
+                const monthKey = d.date.substring(0, 7); // YYYY-MM
+                return !monthMap.has(monthKey); // Remove prediction if historical exists
+            }
+            return true; // Keep all historical data
+        });
+    }
+    tableState.data = tableData;
+    tableState.granularity = granularity;
+    
+    updateChart(chartData, granularity, start, end);
+    applyTableState(selectedDateStr);
+    updateNavigationButtons();
+    
+    // Update recommendations container
+    updateRecommendations();
+    
+    // Trigger chatbot recommendations if available; a newer view replaces a
+    // still-pending analysis instead of queueing another one
+    if (window.chatbotGenerateRecommendations) {
+        clearTimeout(chatbotAnalysisTimer);
+        chatbotAnalysisTimer = setTimeout(() => window.chatbotGenerateRecommendations(), 1000);
+    }
+}
 
-    return "".join(html_parts)
+function updateRecommendations() {
+    const container = recommendationsContainer;
+    if (!container) return;
+    
+    // Get all data for recommendations (use allData, not just filtered chartData)
+    const granularity = currentGranularity;
+    let recommendationData = [];
+    
+    if (allData.length > 0) {
+        // Use all data for recommendations, not just the filtered view
+        recommendationData = allData;
+    }
+    
+    if (recommendationData.length === 0) {
+        container.innerHTML = '<p class="text-muted">Select a granularity and date to see recommendations.</p>';
+        return;
+    }
+    
+    // Use the generateRecommendations function (defined in chatbot section)
+    if (typeof window.generateRecommendations === 'function') {
+        const recommendations = window.generateRecommendations(recommendationData);
+        container.innerHTML = recommendations;
+    } else {
+        container.innerHTML = '<p class="text-muted">Recommendations will appear here once data is loaded.</p>';
+    }
+}
 
+// Filtered and sorted table rows keyed by granularity, type filter and sort
+// order. The data is fixed once loaded, so page flips and switching back to a
+// previous view reuse the result instead of re-sorting
+const sortCache = new Map();
 
-def _format_evaluation_charts(data: dict) -> str:
-    """Format evaluation charts as JavaScript/HTML."""
-    if not data:
-        return ""
+function filterAndSortTable(data, typeFilter, sortCol, sortDir) {
+    // 1. Filter
+    const rows = data.filter(d => 
+        typeFilter === 'all' || d.type === typeFilter
+    );
+    
+    // 2. Sort
+    return rows.sort((a, b) => {
+        // Dates compare as strings (see byDate)
+        let valA = a[sortCol];
+        let valB = b[sortCol];
+        if (sortCol === 'month') {
+            // Sort months by their numeric value
+            const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 
+                              'July', 'August', 'September', 'October', 'November', 'December'];
+            valA = monthNames.indexOf(valA || '');
+            valB = monthNames.indexOf(valB || '');
+        }
+        if (valA < valB) return sortDir === 'asc' ? -1 : 1;
+        if (valA > valB) return sortDir === 'asc' ? 1 : -1;
+        return 0;
+    });
+}
 
-    # Convert data to JSON for JavaScript
-    charts_data = {}
-    for granularity, records in data.items():
-        charts_data[granularity] = records
+function applyTableState(targetDateStr) {
+    const { typeFilter, sortCol, sortDir, pageSize } = tableState;
+    const cacheKey = `${tableState.granularity}|${typeFilter}|${sortCol}|${sortDir}`;
+    
+    // 1-2. Filter and sort, or reuse an earlier result
+    if (sortCache.has(cacheKey)) {
+        tableState.displayData = sortCache.get(cacheKey);
+    } else {
+        tableState.displayData = filterAndSortTable(tableState.data, typeFilter, sortCol, sortDir);
+        sortCache.set(cacheKey, tableState.displayData);
+    }
+    
+    // 3. Auto-navigate to target date if provided
+    if (targetDateStr) {
+        const idx = tableState.displayData.findIndex(d => {
+            if (d.for === 'hourly') return d.date.startsWith(targetDateStr);
+            if (d.for === 'monthly') return d.date.slice(0, 7) === targetDateStr.slice(0, 7);
+            return d.date === targetDateStr;
+        });
+        if (idx !== -1) {
+            tableState.currentPage = Math.floor(idx / pageSize) + 1;
+        }
+    }
+    
+    renderTable();
+}
 
-    return f"""
-    <div id='evaluation-charts'>
-        <script>
-        const evaluationData = {json.dumps(charts_data)};
-        
-        function renderEvaluationCharts() {{
-            const container = document.getElementById('evaluation-charts-container');
-            if (!container || !evaluationData) return;
-            
-            // Clear any existing charts to prevent duplicates
-            container.innerHTML = '';
-            
-            Object.keys(evaluationData).forEach(granularity => {{
-                const data = evaluationData[granularity];
-                if (!data || data.length === 0) return;
-                
-                const chartDiv = document.createElement('div');
-                chartDiv.className = 'card mb-3';
-                chartDiv.innerHTML = `
-                    <div class='card-header fw-semibold'>${{granularity.toUpperCase()}} Predictions vs Actual</div>
-                    <div class='card-body'>
-                        <div id='eval-chart-${{granularity}}' style='height: 400px;'></div>
-                    </div>
-                `;
-                container.appendChild(chartDiv);
-                
-                const dates = data.map(d => d.date);
-                const predictions = data.map(d => parseFloat(d.prediction));
-                const actuals = data.map(d => parseFloat(d.actual));
-                
-                const trace1 = {{
-                    x: dates,
-                    y: actuals,
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    name: 'Actual',
-                    line: {{ color: '#10b981', width: 2 }},
-                    marker: {{ size: 6 }}
-                }};
-                
-                const trace2 = {{
-                    x: dates,
-                    y: predictions,
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    name: 'Predicted',
-                    line: {{ color: '#3b82f6', width: 2, dash: 'dash' }},
-                    marker: {{ size: 6 }}
-                }};
-                
-                const layout = {{
-                    xaxis: {{ title: 'Date' }},
-                    yaxis: {{ title: 'Cost (USD)' }},
-                    height: 400,
-                    legend: {{ orientation: 'h', y: -0.2 }}
-                }};
-                
-                Plotly.newPlot(`eval-chart-${{granularity}}`, [trace1, trace2], layout, {{responsive: true}});
-            }});
-        }}
-        
-        // Render charts immediately if data exists, and when evaluations section is shown
-        if (Object.keys(evaluationData).length > 0) {{
-            // Render charts on page load if data exists
-            setTimeout(renderEvaluationCharts, 100);
-        }}
-        
-        // Also render when evaluations section is shown (in case section was already visible)
-        const navEvaluations = document.getElementById('nav-evaluations');
-        if (navEvaluations) {{
-            navEvaluations.addEventListener('click', () => {{
-                setTimeout(renderEvaluationCharts, 100);
-            }});
-        }}
-        </script>
-    </div>
-    """
-
-
-def _load_hourly_data() -> pd.DataFrame:
-    """Load hourly data from hourly_price files."""
-    hourly_files = sorted(
-        (FEATURES_DIR / "hourly_price").glob("CAISO_Price_*.csv"))
-    if not hourly_files:
-        return pd.DataFrame()
-
-    frames = []
-    for f in hourly_files[-12:]:  # Last 12 months for performance
-        try:
-            df = pd.read_csv(f)
-            if "Date" in df.columns and "HE" in df.columns and "Estimated_Hourly_Cost_USD" in df.columns:
-                df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-                df["HE"] = pd.to_numeric(df["HE"], errors="coerce")
-                df = df.dropna(
-                    subset=["Date", "HE", "Estimated_Hourly_Cost_USD"])
-                df["timestamp"] = df["Date"] + \
-                    pd.to_timedelta(df["HE"] - 1, unit="h")
-                frames.append(
-                    df[["timestamp", "Estimated_Hourly_Cost_USD", "Date", "HE"]])
-        except Exception:
-            continue
-
-    if not frames:
-        return pd.DataFrame()
-
-    hourly = pd.concat(frames, ignore_index=True)
-    hourly = hourly.sort_values(
-        "timestamp").drop_duplicates(subset="timestamp")
-    hourly["hour"] = hourly["timestamp"].dt.hour
-    # Ensure hours are in valid range 0-23
-    hourly["hour"] = hourly["hour"].clip(0, 23)
-    hourly["dayofweek"] = hourly["timestamp"].dt.dayofweek
-    hourly["month"] = hourly["timestamp"].dt.month
-    hourly["year"] = hourly["timestamp"].dt.year
-    return hourly
-
-
-def build():
-    SITE_DIR.mkdir(parents=True, exist_ok=True)
-
-    preds = _read_csv(RESULTS_DIR / "predictions.csv")
-    hourly_history = _read_csv(RESULTS_DIR / "hourly_history.csv")
-    daily = _read_csv(RESULTS_DIR / "daily_history.csv")
-    monthly = _read_csv(RESULTS_DIR / "monthly_history.csv")
-    hourly_features = _load_hourly_data()
-
-    # Use hourly history if available, otherwise fall back to features
-    if not hourly_history.empty and "Estimated_Hourly_Cost_USD" in hourly_history.columns:
-        hourly = hourly_history.copy()
-        if "timestamp" in hourly.columns:
-            hourly["timestamp"] = pd.to_datetime(
-                hourly["timestamp"], errors="coerce")
-        elif "Date" in hourly.columns and "HE" in hourly.columns:
-            hourly["Date"] = pd.to_datetime(hourly["Date"], errors="coerce")
-            hourly["HE"] = pd.to_numeric(hourly["HE"], errors="coerce")
-            hourly = hourly.dropna(
-                subset=["Date", "HE", "Estimated_Hourly_Cost_USD"])
-            hourly["timestamp"] = hourly["Date"] + \
-                pd.to_timedelta(hourly["HE"] - 1, unit="h")
-        else:
-            hourly = hourly_features
-        if "timestamp" in hourly.columns:
-            hourly["hour"] = hourly["timestamp"].dt.hour
-            # Ensure hours are in valid range 0-23
-            hourly["hour"] = hourly["hour"].clip(0, 23)
-            hourly["dayofweek"] = hourly["timestamp"].dt.dayofweek
-            hourly["month"] = hourly["timestamp"].dt.month
-            hourly["year"] = hourly["timestamp"].dt.year
-            if "Date" not in hourly.columns:
-                hourly["Date"] = hourly["timestamp"].dt.date
-    else:
-        hourly = hourly_features
-
-    # Process data for unified view
-    unified_data = []
-
-    # 1. Historical Data
-    # Hourly
-    if not hourly.empty:
-        for _, row in hourly.iterrows():
-            ts = row["timestamp"]
-            unified_data.append({
-                "date": ts.strftime("%Y-%m-%d %H:%M:%S"),
-                "year": int(ts.year),
-                "month": ts.strftime("%B"),  # Full month name
-                "day": int(ts.day),
-                "hour": int(ts.hour),
-                "val": float(row["Estimated_Hourly_Cost_USD"]),
-                "for": "hourly",
-                "type": "historical"
-            })
-
-    # Daily
-    if not daily.empty:
-        for _, row in daily.iterrows():
-            dt = pd.to_datetime(row["date"])
-            unified_data.append({
-                "date": dt.strftime("%Y-%m-%d"),
-                "year": int(dt.year),
-                "month": dt.strftime("%B"),  # Full month name
-                "day": int(dt.day),
-                "val": float(row["Estimated_Hourly_Cost_USD"]),
-                "for": "daily",
-                "type": "historical"
-            })
-
-    # Weekly
-    if not daily.empty:
-        daily["date_dt"] = pd.to_datetime(daily["date"])
-        daily["week_start"] = daily["date_dt"] - \
-            pd.to_timedelta(daily["date_dt"].dt.dayofweek, unit="d")
-        weekly = daily.groupby("week_start")[
-            "Estimated_Hourly_Cost_USD"].sum().reset_index()
-        for _, row in weekly.iterrows():
-            week_start = row["week_start"]
-            week_end = week_start + pd.Timedelta(days=6)
-            # Format as "Jan 1-7, 2025" or "Dec 29 - Jan 4, 2025" if spanning months
-            if week_start.month == week_end.month:
-                date_str = week_start.strftime(
-                    "%b %d") + "-" + week_end.strftime("%d, %Y")
-            else:
-                date_str = week_start.strftime(
-                    "%b %d") + " - " + week_end.strftime("%b %d, %Y")
-            unified_data.append({
-                # Keep ISO format for sorting/filtering
-                "date": week_start.strftime("%Y-%m-%d"),
-                "date_display": date_str,  # Human-readable format
-                "year": int(week_start.year),
-                "month": week_start.strftime("%B"),  # Full month name
-                "val": float(row["Estimated_Hourly_Cost_USD"]),
-                "for": "weekly",
-                "type": "historical"
-            })
-
-    # Monthly
-    if not monthly.empty:
-        for _, row in monthly.iterrows():
-            month_date = pd.to_datetime(row["year_month_start"])
-            # Format as "January 2025" or "Jan 2025"
-            date_str = month_date.strftime("%B %Y")  # Full month name
-            unified_data.append({
-                # Keep ISO format for sorting/filtering
-                "date": month_date.strftime("%Y-%m-%d"),
-                "date_display": date_str,  # Human-readable format
-                "year": int(month_date.year),
-                "month": month_date.strftime("%B"),  # Full month name
-                "val": float(row["Estimated_Hourly_Cost_USD"]),
-                "for": "monthly",
-                "type": "historical"
-            })
-
-    # 2. Prediction Data
-    if not preds.empty:
-        preds["feature_date"] = pd.to_datetime(preds["feature_date"])
-        for _, row in preds.iterrows():
-            gran = str(row["for"]).lower()
-            if "hour" in gran:
-                g = "hourly"
-            elif "day" in gran:
-                g = "daily"
-            elif "week" in gran:
-                g = "weekly"
-            elif "month" in gran:
-                g = "monthly"
-            else:
-                g = "unknown"
-
-            # Format date based on granularity for consistency
-            d_val = row["feature_date"]
-            if g == "monthly":
-                d_str = d_val.strftime("%Y-%m-%d")
-                date_display = d_val.strftime("%B %Y")  # "January 2025"
-                unified_data.append({
-                    "date": d_str,
-                    "date_display": date_display,
-                    "year": int(d_val.year),
-                    "month": d_val.strftime("%B"),  # Full month name
-                    "val": float(row["prediction"]),
-                    "for": g,
-                    "type": "prediction"
-                })
-            elif g == "hourly":
-                d_str = d_val.strftime("%Y-%m-%d %H:%M:%S")
-                date_display = d_str
-                unified_data.append({
-                    "date": d_str,
-                    "date_display": date_display,
-                    "year": int(d_val.year),
-                    "month": d_val.strftime("%B"),  # Full month name
-                    "day": int(d_val.day),
-                    "hour": int(d_val.hour),
-                    "val": float(row["prediction"]),
-                    "for": g,
-                    "type": "prediction"
-                })
-            elif g == "weekly":
-                # Calculate week range
-                week_start = d_val - pd.Timedelta(days=d_val.dayofweek)
-                week_end = week_start + pd.Timedelta(days=6)
-                d_str = week_start.strftime("%Y-%m-%d")
-                if week_start.month == week_end.month:
-                    date_display = week_start.strftime(
-                        "%b %d") + "-" + week_end.strftime("%d, %Y")
-                else:
-                    date_display = week_start.strftime(
-                        "%b %d") + " - " + week_end.strftime("%b %d, %Y")
-                unified_data.append({
-                    "date": d_str,
-                    "date_display": date_display,
-                    "year": int(week_start.year),
-                    "month": week_start.strftime("%B"),  # Full month name
-                    "val": float(row["prediction"]),
-                    "for": g,
-                    "type": "prediction"
-                })
-            else:
-                d_str = d_val.strftime("%Y-%m-%d")
-                date_display = d_str
-                unified_data.append({
-                    "date": d_str,
-                    "date_display": date_display,
-                    "year": int(d_val.year),
-                    "month": d_val.strftime("%B"),  # Full month name
-                    "day": int(d_val.day),
-                    "val": float(row["prediction"]),
-                    "for": g,
-                    "type": "prediction"
-                })
-
-    html_parts = [
-        "<html>",
-        "<head>",
-        "<title>California Residential Energy Spending: History & Predictions</title>",
-        "<link rel='stylesheet' href='https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css'>",
-        "<link rel='stylesheet' href='https://cdn.jsdelivr.net/npm/flatpickr/dist/flatpickr.min.css'>",
-        "<script src='https://cdn.plot.ly/plotly-latest.min.js'></script>",
-        "<script src='https://cdn.jsdelivr.net/npm/flatpickr'></script>",
-        "<style>",
-        "body { font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; background: #f8f9fa; padding-top: 56px; }",
-        ".navbar { z-index: 1030; margin-bottom: 0 !important; width: 100%; }",
-        ".sidebar { background-color: #212529; color: #e5e7eb; min-height: calc(100vh - 56px); padding: 1rem; position: fixed; left: 0; top: 56px; z-index: 1020; transition: transform 0.3s ease, margin-left 0.3s ease; width: 250px; border-top: 1px solid rgba(255,255,255,0.1); }",
-        ".sidebar h6 { font-size: 0.75rem; letter-spacing: .08em; text-transform: uppercase; color: #9ca3af; margin-bottom: 1rem; }",
-        ".sidebar .form-label { font-size: 0.8rem; color: #d1d5db; margin-bottom: 0.5rem; }",
-        ".sidebar .form-select, .sidebar .form-control { background-color: #343a40; border-color: #495057; color: #e5e7eb; }",
-        ".sidebar .form-select:focus, .sidebar .form-control:focus { background-color: #343a40; border-color: #6c757d; color: #e5e7eb; }",
-        ".stat-card { background: white; border-radius: 8px; padding: 1rem; box-shadow: 0 1px 3px rgba(0,0,0,0.1); }",
-        ".sidebar.hidden { transform: translateX(-250px); }",
-        ".hamburger-btn { background: none; border: none; color: white; font-size: 1.5rem; padding: 0.5rem; cursor: pointer; margin-right: 0.5rem; }",
-        ".hamburger-btn:hover { opacity: 0.8; }",
-        ".sidebar-overlay { display: none; position: fixed; top: 56px; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 999; }",
-        ".sidebar-overlay.show { display: block; }",
-        "@media (min-width: 768px) { .sidebar-overlay { display: none !important; } }",
-        "@media (min-width: 768px) { .sidebar { position: fixed; transform: none; } .sidebar.hidden { transform: translateX(-250px); } }",
-        "main { transition: margin-left 0.3s ease; margin-left: 250px; }",
-        "main.full-width { margin-left: 0; }",
-        "@media (max-width: 767px) { main { margin-left: 0; } }",
-        ".sidebar .nav-link { color: #d1d5db; padding: 0.5rem 1rem; border-radius: 4px; margin-bottom: 0.25rem; font-size: 0.9rem; border: 1px solid transparent; transition: all 0.2s; cursor: pointer; }",
-        ".sidebar .nav-link:hover { background-color: #343a40; color: white; }",
-        ".sidebar .nav-link.active { background-color: #3b82f6; color: white; border-color: #3b82f6; }",
-        ".sidebar .nav-link i { margin-right: 0.5rem; }",
-        ".section-hidden { display: none; }",
-        ".about-content { line-height: 1.7; color: #374151; }",
-        ".about-content h2 { color: #111827; margin-top: 1.5rem; }",
-        ".about-content p { margin-bottom: 1.25rem; }",
-        ".sub-header { border-left: 4px solid #3b82f6; padding-left: 0.75rem; margin-bottom: 1.5rem; font-weight: 600; color: #1f2937; }",
-        "th.sortable { cursor: pointer; position: relative; padding-right: 1.5rem !important; }",
-        "th.sortable::after { content: '↕'; position: absolute; right: 0.5rem; opacity: 0.3; }",
-        "th.sortable.asc::after { content: '↑'; opacity: 1; color: #3b82f6; }",
-        "th.sortable.desc::after { content: '↓'; opacity: 1; color: #3b82f6; }",
-        ".pagination-controls { display: flex; justify-content: space-between; align-items: center; margin-top: 1rem; flex-wrap: wrap; gap: 0.5rem; }",
-        ".btn:disabled, .btn.disabled { opacity: 0.5; cursor: not-allowed; pointer-events: none; }",
-        ".flatpickr-day.disabled, .flatpickr-day.not-allowed { opacity: 0.3; cursor: not-allowed; }",
-        ".flatpickr-day.disabled:hover, .flatpickr-day.not-allowed:hover { background: transparent; }",
-        ".chatbot-container { position: fixed; bottom: 20px; right: 20px; width: 380px; max-height: 600px; z-index: 1000; box-shadow: 0 4px 12px rgba(0,0,0,0.15); border-radius: 12px; overflow: hidden; background: white; display: none; }",
-        ".chatbot-container.open { display: flex; flex-direction: column; }",
-        ".chatbot-header { background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); color: white; padding: 1rem; display: flex; justify-content: space-between; align-items: center; cursor: pointer; }",
-        ".chatbot-header h6 { margin: 0; font-weight: 600; }",
-        ".chatbot-body { flex: 1; overflow-y: auto; padding: 1rem; background: #f8f9fa; max-height: 450px; }",
-        ".chatbot-message { margin-bottom: 1rem; padding: 0.75rem; border-radius: 8px; }",
-        ".chatbot-message.user { background: #e3f2fd; margin-left: 2rem; }",
-        ".chatbot-message.assistant { background: white; margin-right: 2rem; border-left: 3px solid #3b82f6; }",
-        ".chatbot-input-container { padding: 1rem; background: white; border-top: 1px solid #e5e7eb; display: flex; gap: 0.5rem; }",
-        ".chatbot-input { flex: 1; border: 1px solid #d1d5db; border-radius: 6px; padding: 0.5rem; font-size: 0.9rem; }",
-        ".chatbot-toggle { position: fixed; bottom: 20px; right: 20px; width: 60px; height: 60px; border-radius: 50%; background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); color: white; border: none; box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4); cursor: pointer; z-index: 999; display: flex; align-items: center; justify-content: center; font-size: 1.5rem; transition: transform 0.2s; }",
-        ".chatbot-toggle:hover { transform: scale(1.1); }",
-        ".chatbot-toggle.hidden { display: none; }",
-        ".recommendation-badge { display: inline-block; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; font-weight: 600; margin-left: 0.5rem; }",
-        ".recommendation-badge.best { background: #10b981; color: white; }",
-        ".recommendation-badge.good { background: #3b82f6; color: white; }",
-        ".recommendation-badge.avoid { background: #ef4444; color: white; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        "<nav class='navbar navbar-dark bg-dark px-3 fixed-top'>",
-        "<button class='hamburger-btn' id='sidebar-toggle' aria-label='Toggle menu'>☰</button>",
-        "<span class='navbar-brand ms-2'>California Residential Energy Spending</span>",
-        "</nav>",
-        "<div class='sidebar-overlay' id='sidebar-overlay'></div>",
-        "<div class='container-fluid'>",
-        "<div class='row'>",
-        "<aside class='col-md-3 col-lg-2 sidebar' id='sidebar'>",
-        "<div class='mb-4'>",
-        "<h6>Navigation</h6>",
-        "<div class='nav flex-column'>",
-        "<div class='nav-link active' id='nav-dashboard'>Dashboard</div>",
-        "<div class='nav-link' id='nav-evaluations'>Evaluations</div>",
-        "<div class='nav-link' id='nav-about'>About</div>",
-        "</div>",
-        "</div>",
-        "<div id='sidebar-filters'>",
-        "<h6>Time Filtering</h6>",
-        "<div class='mb-3'>",
-        "<label for='granularity' class='form-label'>View</label>",
-        "<select id='granularity' class='form-select form-select-sm'>",
-        "<option value='hourly'>Hourly</option>",
-        "<option value='daily'>Daily</option>",
-        "<option value='weekly'>Weekly</option>",
-        "<option value='monthly' selected>Monthly</option>",
-        "</select>",
-        "</div>",
-        "<div class='mb-3'>",
-        "<label for='date-range' class='form-label'>Date Range</label>",
-        "<div class='input-group input-group-sm'>",
-        "<input type='text' id='date-range' class='form-control form-control-sm' placeholder='Select range...'>",
-        "<button type='button' id='today-btn' class='btn btn-outline-primary btn-sm' title='Go to current period'>Today</button>",
-        "</div>",
-        "</div>",
-        "<div class='mb-3' id='period-navigation' style='display:none;'>",
-        "<label for='period-select' class='form-label' id='period-label'>Navigate to</label>",
-        "<select id='period-select' class='form-select form-select-sm'>",
-        "<option value=''>Select period...</option>",
-        "</select>",
-        "</div>",
-        "</div>",
-        "</aside>",
-        "<main class='col-md-9 col-lg-10 py-3'>",
-        "<div id='section-dashboard'>",
-        "    <div class='card mb-3'>",
-        "        <div class='card-header fw-semibold text-primary d-flex justify-content-between align-items-center'>",
-        "            <span>Visual Trends</span>",
-        "            <div class='btn-group btn-group-sm' role='group'>",
-        "                <button type='button' class='btn btn-outline-primary' id='chart-prev-btn' title='Previous period'>",
-        "                    <svg xmlns='http://www.w3.org/2000/svg' width='16' height='16' fill='currentColor' class='bi bi-chevron-left' viewBox='0 0 16 16'><path fill-rule='evenodd' d='M11.354 1.646a.5.5 0 0 1 0 .708L5.707 8l5.647 5.646a.5.5 0 0 1-.708.708l-6-6a.5.5 0 0 1 0-.708l6-6a.5.5 0 0 1 .708 0z'/></svg>",
-        "                </button>",
-        "                <button type='button' class='btn btn-outline-primary' id='chart-next-btn' title='Next period'>",
-        "                    <svg xmlns='http://www.w3.org/2000/svg' width='16' height='16' fill='currentColor' class='bi bi-chevron-right' viewBox='0 0 16 16'><path fill-rule='evenodd' d='M4.646 1.646a.5.5 0 0 1 .708 0l6 6a.5.5 0 0 1 0 .708l-6 6a.5.5 0 0 1-.708-.708L10.293 8 4.646 2.354a.5.5 0 0 1 0-.708z'/></svg>",
-        "                </button>",
-        "            </div>",
-        "        </div>",
-        "        <div class='card-body'>",
-        "            <div id='energy-chart-container' class='mb-4'></div>",
-        "        </div>",
-        "    </div>",
-        "    <div class='card mb-3'>",
-        "        <div class='card-header fw-semibold text-primary'>Detailed Data Breakdown</div>",
-        "        <div class='card-body'>",
-        "            <div class='row g-3 mb-3'>",
-        "                <div class='col-auto'>",
-        "                    <label class='form-label small fw-bold text-muted mb-1'>Filter by Type</label>",
-        "                    <select id='table-type-filter' class='form-select form-select-sm' style='width: 150px;'>",
-        "                        <option value='all'>All Types</option>",
-        "                        <option value='historical'>Historical</option>",
-        "                        <option value='prediction'>Prediction</option>",
-        "                    </select>",
-        "                </div>",
-        "                <div class='col-auto ms-auto d-flex align-items-end'>",
-        "                    <label class='form-label small fw-bold text-muted me-2 mb-2'>Show</label>",
-        "                    <select id='table-page-size' class='form-select form-select-sm' style='width: 70px;'>",
-        "                        <option value='10'>10</option>",
-        "                        <option value='25'>25</option>",
-        "                        <option value='50'>50</option>",
-        "                    </select>",
-        "                </div>",
-        "            </div>",
-        "            <div class='table-responsive'>",
-        "                <table id='energy-table' class='table table-sm table-hover table-striped mb-0'>",
-        "                    <thead>",
-        "                        <tr>",
-        "                            <th>Type</th>",
-        "                            <th class='sortable' data-sort='val' id='sort-cost'>Cost</th>",
-        "                            <th class='sortable date-col' data-sort='year' id='col-year' style='display:none;'>Year</th>",
-        "                            <th class='sortable date-col' data-sort='month' id='col-month' style='display:none;'>Month</th>",
-        "                            <th class='sortable date-col' data-sort='day' id='col-day' style='display:none;'>Day</th>",
-        "                            <th class='sortable date-col' data-sort='hour' id='col-hour' style='display:none;'>Hour</th>",
-        "                        </tr>",
-        "                    </thead>",
-        "                    <tbody id='energy-table-body'></tbody>",
-        "                </table>",
-        "            </div>",
-        "            <div class='pagination-controls'>",
-        "                <div class='small text-muted' id='pagination-info'>Showing 1 to 10 of 0 entries</div>",
-        "                <nav aria-label='Table navigation'>",
-        "                    <ul class='pagination pagination-sm mb-0' id='pagination-list'></ul>",
-        "                </nav>",
-        "            </div>",
-        "        </div>",
-        "    </div>",
-        "    <div class='card mb-3'>",
-        "        <div class='card-header fw-semibold text-primary'>Energy Usage Recommendations</div>",
-        "        <div class='card-body'>",
-        "            <div id='recommendations-container'></div>",
-        "        </div>",
-        "    </div>",
-        "</div>",
-    ]
-
-    # Evaluations Section
-    # Dynamically find the most recent evaluation directory
-    eval_dir = None
-    eval_metrics = {}
-    eval_data = {}
-
-    # Find all evaluation directories (evaluation_YYYY)
-    if RESULTS_DIR.exists():
-        eval_dirs = [d for d in RESULTS_DIR.iterdir()
-                     if d.is_dir() and d.name.startswith("evaluation_")]
-        if eval_dirs:
-            # Sort by directory name (which includes year) and get the most recent
-            eval_dirs.sort(key=lambda x: x.name, reverse=True)
-            eval_dir = eval_dirs[0]
-            print(f"Found evaluation directory: {eval_dir.name}")
-
-    if eval_dir and (eval_dir / "metrics_summary.json").exists():
-        with open(eval_dir / "metrics_summary.json", "r") as f:
-            eval_metrics = json.load(f)
-
-    # Load evaluation prediction vs actual data
-    if eval_dir:
-        for granularity in ["daily", "weekly", "monthly"]:
-            eval_file = eval_dir / f"{granularity}_predictions_vs_actual.csv"
-            if eval_file.exists():
-                df = pd.read_csv(eval_file)
-                eval_data[granularity] = df.to_dict("records")
-
-    # Extract year from eval_dir name if available
-    eval_year = None
-    if eval_dir:
-        try:
-            year_part = eval_dir.name.replace("evaluation_", "")
-            eval_year = year_part
-        except:
-            pass
-
-    # Build header and description based on whether evaluation exists
-    if eval_year:
-        header_text = f"Model Performance Evaluation ({eval_year} Predictions)"
-        description_text = f"This evaluation compares model predictions against actual data for {eval_year}. Models were trained on historical data up to the start of {eval_year} and used to predict {eval_year} values."
-    else:
-        header_text = "Model Performance Evaluation"
-        description_text = "This evaluation compares model predictions against actual data for the last complete year of available data. Models are trained on historical data up to the start of the evaluation year and used to predict values for that year."
-
-    html_parts.append(f"""
-<div id='section-evaluations' class='section-hidden'>
-    <div class='card mb-3'>
-        <div class='card-header fw-semibold text-primary'>{header_text}</div>
-        <div class='card-body'>
-            <p class='text-muted mb-4'>{description_text}</p>
-            
-            <div id='evaluation-metrics-container'>
-                {_format_evaluation_metrics(eval_metrics) if eval_metrics else '<p class="text-muted">Evaluation results not yet available. Run <code>python model/evaluate.py</code> to generate evaluation metrics.</p>'}
-            </div>
-            
-            <div id='evaluation-charts-container' class='mt-4'>
-                {_format_evaluation_charts(eval_data) if eval_data else ''}
-            </div>
-        </div>
-    </div>
-</div>
-""")
-
-    # About Section
-    html_parts.append(f"""
-<div id='section-about' class='section-hidden'>
-    <div class='card mb-3'>
-        <div class='card-header fw-semibold text-primary'>About This Project</div>
-        <div class='card-body about-content'>
-            <h2 class="h4 mb-3">Motivation</h2>
-            <p>Southern California experiences some of the highest electricity demand in the United States due to a combination of factors such as widespread air-conditioning use, a growing number of electric vehicles, and increasing residential and commercial energy consumption. During hot summer months, cooling loads drive peak demand in the late afternoon and evening, while electric vehicle charging and household activities further elevate nighttime consumption. These demand patterns often lead to periods of high electricity prices, even when consumers are unaware of the cost differences throughout the day.</p>
-            
-            <p>At the same time, many energy-intensive activities—such as EV charging, running laundry, or operating large appliances—can be shifted to hours when electricity is cheaper. Identifying these “optimal usage windows” has the potential to reduce household energy bills, ease stress on the electric grid, and support more efficient use of renewable generation.</p>
-            
-            <p>However, hourly electricity prices are not always publicly available for Southern California, and consumers rarely have access to clear or actionable guidance about when electricity is most affordable. This project addresses this gap by estimating hourly electricity costs using available demand, generation, and weather data, and by forecasting prices for the next day. With these predictions, the system provides users with intuitive recommendations about the best times to use electricity.</p>
-            
-            <p>By helping consumers shift demand to lower-cost hours, the project supports both economic savings and grid reliability, while also encouraging more sustainable energy behavior in a region where electricity demand continues to rise.</p>
-        </div>
-    </div>
-</div>
-""")
+// Granularity the date columns were last shown/hidden for
+let lastColsGranularity = null;
+// Pagination markup currently in the list
+let lastPaginationHtml = null;
 
-    # Extract valid dates for flatpickr enable list
-    all_valid_dates = sorted(
-        list(set([d["date"].split(' ')[0] for d in unified_data])))
+function updateTableColumns(granularity) {
+    // Paging and sorting re-render without changing granularity
+    if (granularity === lastColsGranularity) return;
+    lastColsGranularity = granularity;
+    
+    // Show/hide columns based on granularity
+    if (granularity === 'hourly') {
+        yearCol.style.display = '';
+        monthCol.style.display = '';
+        dayCol.style.display = '';
+        hourCol.style.display = '';
+    } else if (granularity === 'daily') {
+        yearCol.style.display = '';
+        monthCol.style.display = '';
+        dayCol.style.display = '';
+        hourCol.style.display = 'none';
+    } else if (granularity === 'weekly') {
+        yearCol.style.display = '';
+        monthCol.style.display = '';
+        dayCol.style.display = 'none';
+        hourCol.style.display = 'none';
+    } else if (granularity === 'monthly') {
+        yearCol.style.display = '';
+        monthCol.style.display = '';
+        dayCol.style.display = 'none';
+        hourCol.style.display = 'none';
+    }
+}
 
-    # Unified Dashboard Script (Historical + Predictions)
-    html_parts.append(f"""
-<script>
-const allData = {json.dumps(unified_data)};
-const validDates = {json.dumps(all_valid_dates)};
-let fp; 
+function renderTable() {
+    const { pageSize, currentPage, displayData } = tableState;
+    
+    // Get current granularity from the select
+    const granularity = currentGranularity;
+    updateTableColumns(granularity);
+    
+    const totalEntries = displayData.length;
+    const totalPages = Math.ceil(totalEntries / pageSize) || 1;
+    const normalizedPage = Math.min(currentPage, totalPages);
+    tableState.currentPage = normalizedPage;
+    
+    const startIdx = (normalizedPage - 1) * pageSize;
+    const endIdx = Math.min(startIdx + pageSize, totalEntries);
+    const splitData = displayData.slice(startIdx, endIdx);
+    
+    const dateFields = TABLE_DATE_FIELDS[granularity] || [];
+    let rowsHtml = splitData.map(d => {
+        let cells = `<td>${TYPE_BADGES[d.type]}</td><td><strong>$${d.valText}</strong></td>`;
+        for (const field of dateFields) {
+            const v = d[field];
+            cells += `<td class="text-muted small">${v !== undefined ? v : ''}</td>`;
+        }
+        return `<tr>${cells}</tr>`;
+    }).join('');
+    
+    if (displayData.length === 0) {
+        const colCount = granularity === 'hourly' ? 6 : granularity === 'daily' ? 5 : 4;
+        rowsHtml = `<tr><td colspan="${colCount}" class="text-center text-muted py-4">No data available for this selection</td></tr>`;
+    }
+    
+    // Update Pagination UI
+    const infoText = totalEntries > 0 
+        ? `Showing ${startIdx + 1} to ${endIdx} of ${totalEntries} entries`
+        : `Showing 0 to 0 of 0 entries`;
+        
+    // Build the pagination markup as one string
+    const pageLink = (page, label, cls) =>
+        `<li class="page-item ${cls}"><a class="page-link" href="#" onclick="changePage(${page})">${label}</a></li>`;
+    const pageItems = [pageLink(normalizedPage - 1, 'Previous', normalizedPage === 1 ? 'disabled' : '')];
+    
+    // Pages (Show 5 around current)
+    for (let i = 1; i <= totalPages; i++) {
+        if (totalPages > 5) {
+            if (i > normalizedPage + 2 || i < normalizedPage - 2) continue;
+        }
+        pageItems.push(pageLink(i, i, i === normalizedPage ? 'active' : ''));
+    }
+    
+    pageItems.push(pageLink(normalizedPage + 1, 'Next',
+        normalizedPage === totalPages || totalEntries === 0 ? 'disabled' : ''));
+    
+    // Apply all three updates together, once each, after the markup is built
+    tableBody.innerHTML = rowsHtml;
+    paginationInfo.textContent = infoText;
+    // Sorting, filtering and same-page renders often leave the page links
+    // as they were; only re-parse them when the markup actually changes
+    const paginationHtml = pageItems.join('');
+    if (paginationHtml !== lastPaginationHtml) {
+        paginationList.innerHTML = paginationHtml;
+        lastPaginationHtml = paginationHtml;
+    }
+}
 
-// Table State
-let tableState = {{
-    data: [], // Currently filtered and windowed data
-    displayData: [], // After type filter and sort
-    typeFilter: 'all',
-    sortCol: 'date',
-    sortDir: 'desc',
-    pageSize: 10,
-    currentPage: 1
-}};
+function changePage(p) {
+    if (p < 1) return;
+    tableState.currentPage = p;
+    renderTable();
+}
 
-function updateView() {{
-    const granularityIdx = document.getElementById('granularity');
-    if (!granularityIdx) return;
-    const granularity = granularityIdx.value;
-    const selectedDateStr = document.getElementById('date-range').value || (fp ? fp.formatDate(fp.selectedDates[0], 'Y-m-d') : '');
+function handleSort(col) {
+    if (tableState.sortCol === col) {
+        tableState.sortDir = tableState.sortDir === 'asc' ? 'desc' : 'asc';
+    } else {
+        tableState.sortCol = col;
+        tableState.sortDir = 'asc';
+    }
     
-    if (!selectedDateStr) return;
+    // Update Header Icons
+    document.querySelectorAll('th.sortable').forEach(th => th.classList.remove('asc', 'desc'));
+    let activeTh;
+    if (col === 'val') {
+        activeTh = document.getElementById('sort-cost');
+    } else if (col === 'year') {
+        activeTh = yearCol;
+    } else if (col === 'month') {
+        activeTh = monthCol;
+    } else if (col === 'day') {
+        activeTh = dayCol;
+    } else if (col === 'hour') {
+        activeTh = hourCol;
+    }
+    if (activeTh) activeTh.classList.add(tableState.sortDir);
     
-    const selectedDate = new Date(selectedDateStr + 'T00:00:00');
-    let start, end;
-
-    if (granularity === 'hourly') {{
-        start = new Date(selectedDate);
-        end = new Date(selectedDate);
-        end.setHours(23, 59, 59);
-    }} else if (granularity === 'daily') {{
-        start = new Date(selectedDate);
-        const day = start.getDay();
-        const diff = start.getDate() - day + (day === 0 ? -6 : 1);
-        start.setDate(diff);
-        start.setHours(0,0,0,0);
-        end = new Date(start);
-        end.setDate(start.getDate() + 6);
-        end.setHours(23, 59, 59);
-    }} else if (granularity === 'weekly') {{
-        start = new Date(selectedDate.getFullYear(), selectedDate.getMonth(), 1);
-        end = new Date(selectedDate.getFullYear(), selectedDate.getMonth() + 1, 0);
-        end.setHours(23, 59, 59);
-    }} else if (granularity === 'monthly') {{
-        start = new Date(selectedDate.getFullYear(), 0, 1);
-        end = new Date(selectedDate.getFullYear(), 11, 31);
-        end.setHours(23, 59, 59);
-    }}
+    applyTableState();
+}
 
-    // Chart still uses windowed data
-    let chartData = allData.filter(d => {{
-        if (d.for !== granularity) return false;
-        if (granularity === 'monthly') {{
-            // For monthly, compare by year only
-            const dDate = new Date(d.date);
-            const dYear = dDate.getFullYear();
-            return dYear === selectedDate.getFullYear();
-        }} else {{
-            const dDate = new Date(d.date);
-            return dDate >= start && dDate <= end;
-        }}
-    }});
+function updateChart(data, granularity, start, end) {
+    // Plotly is deferred; a view update fired before it runs has nothing to draw
+    if (!chartContainer || typeof Plotly === 'undefined') return;
     
-    // Remove predictions if historical data exists for the same month
-    if (granularity === 'monthly') {{
+    // Sort all data by date to ensure proper ordering
+    const sortedData = [...data].sort(byDate);
+    
+    // For monthly data, handle duplicates: if same month exists in both historical and prediction,
+    // prefer historical over prediction
+    let processedData = sortedData;
+    if (granularity === 'monthly') {
         const monthMap = new Map();
-        // First pass: identify which months have historical data
-        chartData.forEach(d => {{
-            if (d.type === 'historical') {{
-                const monthKey = d.date.substring(0, 7); // YYYY-MM
-                monthMap.set(monthKey, true);
-            }}
-        }});
-        // Second pass: filter out predictions for months that have historical data
-        chartData = chartData.filter(d => {{
-            if (d.type === 'prediction') {{
-                const monthKey = d.date.substring(0, 7); // YYYY-MM
-                return !monthMap.has(monthKey); // Remove prediction if historical exists
-            }}
-            return true; // Keep all historical data
-        }});
-    }}
+        // First pass: collect all data by month, preferring historical
+        sortedData.forEach(d => {
+            const monthKey = d.date.substring(0, 7); // YYYY-MM
+            if (!monthMap.has(monthKey)) {
+                // No data for this month yet, add it
+                monthMap.set(monthKey, d);
+            } else if (d.type === 'historical' && monthMap.get(monthKey).type === 'prediction') {
+                // Historical exists and current map has prediction, replace with historical
+                monthMap.set(monthKey, d);
+            }
+            // If map already has historical, keep it (don't replace with prediction)
+        });
+        processedData = Array.from(monthMap.values()).sort(byDate);
+    }
     
-    // For monthly/yearly view: if only one month of data for the selected year,
-    // include the previous 2 months for context
-    if (granularity === 'monthly' && chartData.length > 0) {{
-        const monthsInYear = chartData.filter(d => {{
-            const dDate = new Date(d.date);
-            return dDate.getFullYear() === selectedDate.getFullYear();
-        }});
-        
-        // Count unique months in the selected year
-        const uniqueMonths = new Set(monthsInYear.map(d => {{
-            const dDate = new Date(d.date);
-            const year = dDate.getFullYear();
-            const month = dDate.getMonth() + 1;
-            const monthStr = month < 10 ? '0' + month : month.toString();
-            return year + '-' + monthStr;
-        }}));
+    // Split into historical/prediction x and y arrays in a single pass
+    const histX = [], histY = [], predX = [], predY = [];
+    let lastHist = null, firstPred = null;
+    for (const d of processedData) {
+        if (d.type === 'historical') {
+            histX.push(d.date_display || d.date);
+            histY.push(d.val);
+            lastHist = d;
+        } else if (d.type === 'prediction') {
+            predX.push(d.date_display || d.date);
+            predY.push(d.val);
+            if (!firstPred) firstPred = d;
+        }
+    }
+    const traces = [];
+    
+    if (lastHist) {
+        traces.push({
+            x: histX,
+            y: histY,
+            type: 'scatter',
+            mode: 'lines+markers',
+            name: 'Historical Cost',
+            line: { color: '#64748b', width: 2 },
+            marker: { size: 6 },
+            hovertemplate: '<b>%{x}</b><br>Cost: $%{y:.2f}<extra></extra>'
+        });
+    }
+    
+    if (firstPred) {
+        // For monthly, ensure smooth connection between historical and predictions
+        let connectX = predX;
+        let connectY = predY;
         
-        // If only one month in the selected year, add previous 2 months
-        if (uniqueMonths.size === 1) {{
-            const selectedYear = selectedDate.getFullYear();
-            const prevYear = selectedYear - 1;
+        if (granularity === 'monthly' && lastHist) {
+            const lastHistDate = new Date(lastHist.date);
+            const firstPredDate = new Date(firstPred.date);
             
-            // Get previous 2 months (November and December of previous year)
-            const prevMonths = allData.filter(d => {{
-                if (d.for !== 'monthly') return false;
-                const dDate = new Date(d.date);
-                const dYear = dDate.getFullYear();
-                const dMonth = dDate.getMonth() + 1; // 1-12
-                // Include November (11) and December (12) of previous year
-                return dYear === prevYear && (dMonth === 11 || dMonth === 12);
-            }});
+            // Calculate month difference
+            const monthsDiff = (firstPredDate.getFullYear() - lastHistDate.getFullYear()) * 12 + 
+                              (firstPredDate.getMonth() - lastHistDate.getMonth());
             
-            // Combine previous months with current year data, sorted by date
-            chartData = [...prevMonths, ...chartData].sort((a, b) => {{
-                return new Date(a.date) - new Date(b.date);
-            }});
-        }}
-    }}
+            // If predictions start immediately after historical (adjacent months), 
+            // add the last historical point to create a smooth transition
+            if (monthsDiff === 1) {
+                connectX = [lastHist.date_display || lastHist.date, ...connectX];
+                connectY = [lastHist.val, ...connectY];
+            }
+        }
+        
+        traces.push({
+            x: connectX,
+            y: connectY,
+            type: 'scatter',
+            mode: 'lines+markers',
+            name: 'Predicted Cost',
+            line: { color: '#3b82f6', width: 3, dash: 'dash' },
+            marker: { size: 8 },
+            hovertemplate: '<b>%{x}</b><br>Cost: $%{y:.2f}<extra></extra>',
+            connectgaps: true
+        });
+    }
     
-    // Table shows all data for this granularity
-    // For monthly: remove predictions if historical exists for the same month
-    let tableData = allData.filter(d => d.for === granularity);
-    if (granularity === 'monthly') {{
-        const monthMap = new Map();
-        // First pass: identify which months have historical data
-        tableData.forEach(d => {{
-            if (d.type === 'historical') {{
-                const monthKey = d.date.substring(0, 7); // YYYY-MM
-                monthMap.set(monthKey, true);
-            }}
-        }});
-        // Second pass: filter out predictions for months that have historical data
-        tableData = tableData.filter(d => {{
-            if (d.type === 'prediction') {{
-                const monthKey = d.date.substring(0, 7); // YYYY-MM
-                return !monthMap.has(monthKey); // Remove prediction if historical exists
-            }}
-            return true; // Keep all historical data
-        }});
-    }}
-    tableState.data = tableData;
+    const titleDate = start.toLocaleDateString(undefined, { 
+        year: 'numeric', 
+        month: granularity === 'monthly' ? undefined : 'short', 
+        day: (granularity === 'hourly' || granularity === 'daily') ? 'numeric' : undefined 
+    });
+                
+                const layout = {
+        title: `${granularity.charAt(0).toUpperCase() + granularity.slice(1)} Spending (${titleDate}${granularity !== 'hourly' ? ' context' : ''})`,
+        xaxis: { title: 'Time' },
+        yaxis: { title: 'Cost (USD)' },
+        margin: { t: 40, b: 40, l: 60, r: 20 },
+        height: 450,
+        legend: { orientation: 'h', y: -0.2 }
+    };
     
-    updateChart(chartData, granularity, start, end);
-    applyTableState(selectedDateStr);
-    updateNavigationButtons();
+    // react diffs against the chart already in the container (and behaves
+    // like newPlot the first time) instead of rebuilding it from scratch
+    Plotly.react(chartContainer, traces, layout, {responsive: true});
+}
+
+function updateNavigationButtons() {
+    const granularity = currentGranularity;
+    const currentDateStr = dateRangeInput.value || (fp ? fp.formatDate(fp.selectedDates[0], 'Y-m-d') : '');
+    const prevBtn = chartPrevBtn;
+    const nextBtn = chartNextBtn;
     
-    // Update recommendations container
-    updateRecommendations();
+    if (!currentDateStr || !prevBtn || !nextBtn) {
+        if (prevBtn) {
+            prevBtn.disabled = true;
+            prevBtn.classList.add('disabled');
+        }
+        if (nextBtn) {
+            nextBtn.disabled = true;
+            nextBtn.classList.add('disabled');
+        }
+        return;
+    }
     
-    // Trigger chatbot recommendations if available
-    if (window.chatbotGenerateRecommendations) {{
-        setTimeout(() => window.chatbotGenerateRecommendations(), 1000);
-    }}
-}}
-
-function updateRecommendations() {{
-    const container = document.getElementById('recommendations-container');
-    if (!container) return;
+    const currentDate = new Date(currentDateStr + 'T00:00:00');
+    // validDates is sorted, so "some date before/after" only needs checking
+    // against its first/last entry
+    const firstDate = validDates[0];
+    const lastDate = validDates[validDates.length - 1];
+    const hasDates = validDates.length > 0;
     
-    // Get all data for recommendations (use allData, not just filtered chartData)
-    const granularity = document.getElementById('granularity')?.value || 'monthly';
-    let recommendationData = [];
+    // Check if there's data for previous period
+    let hasPrevData = false;
+    if (granularity === 'hourly') {
+        const prevDate = new Date(currentDate);
+        prevDate.setDate(currentDate.getDate() - 1);
+        const prevDateStr = prevDate.toISOString().split('T')[0];
+        hasPrevData = hasDates && firstDate <= prevDateStr && firstDate < currentDateStr;
+    } else if (granularity === 'daily') {
+        const prevDate = new Date(currentDate);
+        prevDate.setDate(currentDate.getDate() - 7);
+        const prevDateStr = prevDate.toISOString().split('T')[0];
+        hasPrevData = hasDates && firstDate <= prevDateStr && firstDate < currentDateStr;
+    } else if (granularity === 'weekly') {
+        const prevDate = new Date(currentDate);
+        prevDate.setMonth(currentDate.getMonth() - 1);
+        const prevDateStr = prevDate.toISOString().split('T')[0];
+        hasPrevData = hasDates && firstDate <= prevDateStr && firstDate < currentDateStr;
+    } else if (granularity === 'monthly') {
+        hasPrevData = hasDates &&
+            new Date(firstDate + 'T00:00:00').getFullYear() < currentDate.getFullYear();
+    }
+    
+    // Check if there's data for next period
+    let hasNextData = false;
+    if (granularity === 'hourly') {
+        const nextDate = new Date(currentDate);
+        nextDate.setDate(currentDate.getDate() + 1);
+        const nextDateStr = nextDate.toISOString().split('T')[0];
+        hasNextData = hasDates && lastDate >= nextDateStr && lastDate > currentDateStr;
+    } else if (granularity === 'daily') {
+        const nextDate = new Date(currentDate);
+        nextDate.setDate(currentDate.getDate() + 7);
+        const nextDateStr = nextDate.toISOString().split('T')[0];
+        hasNextData = hasDates && lastDate >= nextDateStr && lastDate > currentDateStr;
+    } else if (granularity === 'weekly') {
+        const nextDate = new Date(currentDate);
+        nextDate.setMonth(currentDate.getMonth() + 1);
+        const nextDateStr = nextDate.toISOString().split('T')[0];
+        hasNextData = hasDates && lastDate >= nextDateStr && lastDate > currentDateStr;
+    } else if (granularity === 'monthly') {
+        hasNextData = hasDates &&
+            new Date(lastDate + 'T00:00:00').getFullYear() > currentDate.getFullYear();
+    }
+    
+    // Update button states
+    prevBtn.disabled = !hasPrevData;
+    nextBtn.disabled = !hasNextData;
+    
+    // Add/remove disabled class for styling
+    if (hasPrevData) {
+        prevBtn.classList.remove('disabled');
+    } else {
+        prevBtn.classList.add('disabled');
+    }
+    
+    if (hasNextData) {
+        nextBtn.classList.remove('disabled');
+    } else {
+        nextBtn.classList.add('disabled');
+    }
+}
+
+function navigateChart(direction) {
+    const granularity = currentGranularity;
+    const currentDateStr = dateRangeInput.value || (fp ? fp.formatDate(fp.selectedDates[0], 'Y-m-d') : '');
+    if (!currentDateStr) return;
+    
+    // Prevent navigation if button is disabled
+    const btn = direction === 'prev' ? chartPrevBtn : chartNextBtn;
+    if (btn && btn.disabled) return;
+    
+    const currentDate = new Date(currentDateStr + 'T00:00:00');
+    let newDate = new Date(currentDate);
+    
+    // Navigate based on granularity
+    if (granularity === 'hourly') {
+        newDate.setDate(currentDate.getDate() + (direction === 'next' ? 1 : -1));
+    } else if (granularity === 'daily') {
+        // Navigate by week
+        newDate.setDate(currentDate.getDate() + (direction === 'next' ? 7 : -7));
+    } else if (granularity === 'weekly') {
+        // Navigate by month
+        newDate.setMonth(currentDate.getMonth() + (direction === 'next' ? 1 : -1));
+    } else if (granularity === 'monthly') {
+        // Navigate by year
+        newDate.setFullYear(currentDate.getFullYear() + (direction === 'next' ? 1 : -1));
+    }
+    
+    // Format new date and check if it's valid
+    const newDateStr = newDate.toISOString().split('T')[0];
+    
+    // Find the closest valid date
+    let targetDate = newDateStr;
+    if (!validDateSet.has(newDateStr)) {
+        // Find closest valid date
+        if (direction === 'next') {
+            const idx = firstIndex(validDates, d => d > newDateStr);
+            targetDate = validDates[idx] || validDates[validDates.length - 1];
+        } else {
+            const idx = firstIndex(validDates, d => d >= newDateStr) - 1;
+            targetDate = validDates[idx] || validDates[0];
+        }
+    }
+    
+    // Update date picker and view
+    if (fp) {
+        fp.setDate(targetDate, false); // false = don't trigger onChange
+        updateView(); // Manually trigger updateView
+    } else {
+        dateRangeInput.value = targetDate;
+        updateView();
+    }
+}
+
+// Event Listeners
+document.getElementById('table-type-filter').addEventListener('change', (e) => {
+    tableState.typeFilter = e.target.value;
+    applyTableState();
+});
+
+document.getElementById('table-page-size').addEventListener('change', (e) => {
+    tableState.pageSize = parseInt(e.target.value);
+    applyTableState();
+});
+
+document.querySelectorAll('th.sortable').forEach(th => {
+    th.addEventListener('click', () => handleSort(th.dataset.sort));
+});
+
+// Period dropdown options per granularity, filled lazily by updatePeriodNavigation
+const periodOptionsCache = {};
+
+function updatePeriodNavigation() {
+    const granularity = currentGranularity;
+    
+    if (!periodNav || !periodSelect) return;
+    
+    // Filter data by granularity
+    const filteredData = dataByGranularity[granularity] || [];
+    if (filteredData.length === 0) {
+        periodNav.style.display = 'none';
+        return;
+    }
     
-    if (typeof allData !== 'undefined' && allData.length > 0) {{
-        // Use all data for recommendations, not just the filtered view
-        recommendationData = allData;
-    }}
+    periodNav.style.display = 'block';
     
-    if (recommendationData.length === 0) {{
-        container.innerHTML = '<p class="text-muted">Select a granularity and date to see recommendations.</p>';
-        return;
-    }}
+    // The data never changes after load, so each granularity's options are
+    // computed once and reused on later switches
+    if (!(granularity in periodOptionsCache)) {
+        periodOptionsCache[granularity] = buildPeriodOptions(granularity, filteredData);
+    }
+    const cached = periodOptionsCache[granularity];
     
-    // Use the generateRecommendations function (defined in chatbot section)
-    if (typeof window.generateRecommendations === 'function') {{
-        const recommendations = window.generateRecommendations(recommendationData);
-        container.innerHTML = recommendations;
-    }} else {{
-        container.innerHTML = '<p class="text-muted">Recommendations will appear here once data is loaded.</p>';
-    }}
-}}
+    const frag = document.createDocumentFragment();
+    const placeholder = document.createElement('option');
+    placeholder.value = '';
+    placeholder.textContent = 'Select period...';
+    frag.appendChild(placeholder);
+    if (cached) {
+        periodLabel.textContent = cached.label;
+        cached.options.forEach(([value, label]) => {
+            const option = document.createElement('option');
+            option.value = value;
+            option.textContent = label;
+            frag.appendChild(option);
+        });
+    }
+    periodSelect.replaceChildren(frag);
+}
+
+// Formatters for the period dropdown labels, built once rather than by a
+// toLocaleDateString call per option
+const DAY_OPTION_FORMAT = new Intl.DateTimeFormat('en-US', { weekday: 'short', year: 'numeric', month: 'short', day: 'numeric' });
+const WEEK_START_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+const WEEK_END_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+const MONTH_OPTION_FORMAT = new Intl.DateTimeFormat('en-US', { year: 'numeric', month: 'long' });
+
+// [value, label] pairs for the period dropdown, newest first
+function buildPeriodOptions(granularity, filteredData) {
+    const options = [];
+    if (granularity === 'hourly') {
+        // Show all available days; the bucket is already in date order
+        const days = [...new Set(filteredData.map(d => d.date.split(' ')[0]))].reverse();
+        days.forEach(day => {
+            const date = new Date(day);
+            options.push([day, DAY_OPTION_FORMAT.format(date)]);
+        });
+        return { label: 'Navigate to Day', options };
+    } else if (granularity === 'daily') {
+        // Show all available weeks
+        const weeks = new Map();
+        filteredData.forEach(d => {
+            const date = new Date(d.date);
+            const weekStart = new Date(date);
+            const day = weekStart.getDay();
+            const diff = weekStart.getDate() - day + (day === 0 ? -6 : 1);
+            weekStart.setDate(diff);
+            weekStart.setHours(0, 0, 0, 0);
+            const weekEnd = new Date(weekStart);
+            weekEnd.setDate(weekStart.getDate() + 6);
+            
+            const weekKey = weekStart.toISOString().split('T')[0];
+            if (!weeks.has(weekKey)) {
+                const weekStr = WEEK_START_FORMAT.format(weekStart) + 
+                              ' - ' + WEEK_END_FORMAT.format(weekEnd);
+                weeks.set(weekKey, weekStr);
+            }
+        });
+        options.push(...Array.from(weeks.entries()).sort((a, b) => b[0].localeCompare(a[0])));
+        return { label: 'Navigate to Week', options };
+    } else if (granularity === 'weekly') {
+        // Show all available months
+        const months = new Map();
+        filteredData.forEach(d => {
+            const date = new Date(d.date);
+            const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
+            if (!months.has(monthKey)) {
+                const monthStr = MONTH_OPTION_FORMAT.format(date);
+                months.set(monthKey, monthStr);
+            }
+        });
+        const sortedMonths = Array.from(months.entries()).sort((a, b) => b[0].localeCompare(a[0]));
+        sortedMonths.forEach(([date, label]) => options.push([date + '-01', label]));
+        return { label: 'Navigate to Month', options };
+    } else if (granularity === 'monthly') {
+        // Show all available years
+        const years = [...new Set(filteredData.map(d => {
+            const date = new Date(d.date);
+            return date.getFullYear();
+        }))].sort((a, b) => b - a);
+        years.forEach(year => options.push([`${year}-01-01`, year]));
+        return { label: 'Navigate to Year', options };
+    }
+    return null;
+}
 
-function applyTableState(targetDateStr) {{
-    const {{ typeFilter, sortCol, sortDir, pageSize }} = tableState;
+function handlePeriodNavigation() {
+    if (!periodSelect || !periodSelect.value) return;
     
-    // 1. Filter
-    tableState.displayData = tableState.data.filter(d => 
-        typeFilter === 'all' || d.type === typeFilter
-    );
+    const targetDate = periodSelect.value;
+    // An explicit jump re-renders even to the date already shown, so the
+    // table comes back to that date's page
+    lastViewKey = null;
+    if (fp) {
+        fp.setDate(targetDate, false);
+        updateView();
+    } else {
+        dateRangeInput.value = targetDate;
+        updateView();
+    }
+    periodSelect.value = ''; // Reset selection
+}
+
+// Chart navigation buttons
+chartPrevBtn.addEventListener('click', () => navigateChart('prev'));
+chartNextBtn.addEventListener('click', () => navigateChart('next'));
+
+// Period navigation dropdown
+periodSelect.addEventListener('change', handlePeriodNavigation);
+
+// Update period navigation when granularity changes
+granularitySelect.addEventListener('change', () => {
+    currentGranularity = granularitySelect.value || 'monthly';
+    updatePeriodNavigation();
+    updateView();
+});
+
+
+// Today button handler
+function goToToday() {
+    const granularity = currentGranularity;
+    const now = new Date();
     
-    // 2. Sort
-    tableState.displayData.sort((a, b) => {{
-        let valA = a[sortCol];
-        let valB = b[sortCol];
-        if (sortCol === 'date') {{
-            valA = new Date(valA);
-            valB = new Date(valB);
-        }} else if (sortCol === 'month') {{
-            // Sort months by their numeric value
-            const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 
-                              'July', 'August', 'September', 'October', 'November', 'December'];
-            valA = monthNames.indexOf(valA || '');
-            valB = monthNames.indexOf(valB || '');
-        }}
-        if (valA < valB) return sortDir === 'asc' ? -1 : 1;
-        if (valA > valB) return sortDir === 'asc' ? 1 : -1;
-        return 0;
-    }});
+    // Format today's date as YYYY-MM-DD
+    const todayStr = now.getFullYear() + '-' + 
+                     String(now.getMonth() + 1).padStart(2, '0') + '-' + 
+                     String(now.getDate()).padStart(2, '0');
     
-    // 3. Auto-navigate to target date if provided
-    if (targetDateStr) {{
-        const idx = tableState.displayData.findIndex(d => {{
-            if (d.for === 'hourly') return d.date.startsWith(targetDateStr);
-            if (d.for === 'monthly') return d.date.slice(0, 7) === targetDateStr.slice(0, 7);
-            return d.date === targetDateStr;
-        }});
-        if (idx !== -1) {{
-            tableState.currentPage = Math.floor(idx / pageSize) + 1;
-        }}
-    }}
+    // Check if today is in valid dates, if not, use the most recent valid date
+    let targetDate = todayStr;
+    if (!validDateSet.has(todayStr)) {
+        // Find the closest valid date (prefer past dates)
+        const pastCount = firstIndex(validDates, d => d > todayStr);
+        targetDate = pastCount > 0 ? validDates[pastCount - 1] : validDates[validDates.length - 1];
+    }
     
-    renderTable();
-}}
+    // Set the flatpickr date
+    if (fp) {
+        fp.setDate(targetDate, false); // false = don't trigger onChange immediately
+        lastViewKey = null; // re-render even if already on this date
+        updateView();
+    }
+}
 
-function updateTableColumns(granularity) {{
-    // Show/hide columns based on granularity
-    const yearCol = document.getElementById('col-year');
-    const monthCol = document.getElementById('col-month');
-    const dayCol = document.getElementById('col-day');
-    const hourCol = document.getElementById('col-hour');
-    
-    if (granularity === 'hourly') {{
-        yearCol.style.display = '';
-        monthCol.style.display = '';
-        dayCol.style.display = '';
-        hourCol.style.display = '';
-    }} else if (granularity === 'daily') {{
-        yearCol.style.display = '';
-        monthCol.style.display = '';
-        dayCol.style.display = '';
-        hourCol.style.display = 'none';
-    }} else if (granularity === 'weekly') {{
-        yearCol.style.display = '';
-        monthCol.style.display = '';
-        dayCol.style.display = 'none';
-        hourCol.style.display = 'none';
-    }} else if (granularity === 'monthly') {{
-        yearCol.style.display = '';
-        monthCol.style.display = '';
-        dayCol.style.display = 'none';
-        hourCol.style.display = 'none';
-    }}
-}}
+// Attach event listener to Today button
+const todayBtn = document.getElementById('today-btn');
+if (todayBtn) {
+    todayBtn.addEventListener('click', goToToday);
+}
 
-function renderTable() {{
-    const tbody = document.getElementById('energy-table-body');
-    const {{ pageSize, currentPage, displayData }} = tableState;
+function initDashboard() {
+    // Pick up a selection the browser may have restored after the script ran
+    currentGranularity = granularitySelect.value || 'monthly';
     
-    // Get current granularity from the select
-    const granularity = document.getElementById('granularity')?.value || 'monthly';
-    updateTableColumns(granularity);
+    // Initialize flatpickr
+    fp = flatpickr('#date-range', { 
+        mode: 'single', 
+        dateFormat: 'Y-m-d', 
+        enable: validDates,
+        defaultDate: validDates[validDates.length - 1],
+        onChange: updateView 
+    });
     
-    const totalEntries = displayData.length;
-    const totalPages = Math.ceil(totalEntries / pageSize) || 1;
-    const normalizedPage = Math.min(currentPage, totalPages);
-    tableState.currentPage = normalizedPage;
+    // Initial call
+    updatePeriodNavigation();
+    updateView();
+}
+
+// data.json stores each granularity column-wise ({ field: [values] }) with
+// null marking fields a record doesn't have; rebuild the record objects
+function rowsFromColumns(granularity, columns) {
+    const fields = Object.keys(columns);
+    const n = columns.date ? columns.date.length : 0;
+    const rows = new Array(n);
+    const decimals = granularity === 'hourly' ? 4 : 2;
+    for (let i = 0; i < n; i++) {
+        const row = { for: granularity };
+        for (const field of fields) {
+            const value = columns[field][i];
+            if (value !== null) row[field] = value;
+        }
+        // Formatted once here rather than on every table render
+        row.valText = row.val.toFixed(decimals);
+        rows[i] = row;
+    }
+    return rows;
+}
+
+// Plotly and flatpickr are deferred, so they are only ready once the
+// document has been parsed
+const domReady = new Promise(resolve => {
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', resolve);
+    } else {
+        resolve();
+    }
+});
+
+function loadDashboardData() {
+    // Start the download right away; wait for the libraries before drawing
+    const dataRequest = fetch(DATA_URL).then(response => {
+        // A missing or stale data.json comes back as an HTML error page
+        if (!response.ok) throw new Error(`${DATA_URL}: HTTP ${response.status}`);
+        return response.json();
+    });
+    Promise.all([dataRequest, domReady])
+        .then(([data]) => {
+            dataByGranularity = {};
+            for (const [granularity, columns] of Object.entries(data.dataByGranularity)) {
+                dataByGranularity[granularity] = rowsFromColumns(granularity, columns);
+            }
+            allData = Object.values(dataByGranularity).flat();
+            validDates = data.validDates;
+            validDateSet = new Set(validDates);
+            sortCache.clear();
+            lastViewKey = null;
+            initDashboard();
+        })
+        .catch(err => {
+            console.error('Failed to load dashboard data:', err);
+            chartContainer.innerHTML = '<div class="alert alert-danger m-3">Could not load the dashboard data. Please try reloading the page.</div>';
+        });
+}
+
+loadDashboardData();
+
+// Navigation Logic
+(function() {
+    const navDashboard = document.getElementById('nav-dashboard');
+    const navEvaluations = document.getElementById('nav-evaluations');
+    const navAbout = document.getElementById('nav-about');
+    const sectionDashboard = document.getElementById('section-dashboard');
+    const sectionEvaluations = document.getElementById('section-evaluations');
+    const sectionAbout = document.getElementById('section-about');
+    const sidebarFilters = document.getElementById('sidebar-filters');
+
+    let currentSection = 'dashboard';
     
-    const startIdx = (normalizedPage - 1) * pageSize;
-    const endIdx = Math.min(startIdx + pageSize, totalEntries);
-    const splitData = displayData.slice(startIdx, endIdx);
+    function switchSection(section) {
+        // Re-clicking the active nav item changes nothing
+        if (section === currentSection) return;
+        currentSection = section;
+        
+        // Hide all sections
+        sectionDashboard.classList.add('section-hidden');
+        if (sectionEvaluations) sectionEvaluations.classList.add('section-hidden');
+        sectionAbout.classList.add('section-hidden');
+        
+        // Remove active from all nav items
+        navDashboard.classList.remove('active');
+        if (navEvaluations) navEvaluations.classList.remove('active');
+        navAbout.classList.remove('active');
+        
+        // Show selected section
+        if (section === 'dashboard') {
+            sectionDashboard.classList.remove('section-hidden');
+            navDashboard.classList.add('active');
+            sidebarFilters.style.display = 'block';
+            updateView();
+            // The view is usually unchanged, but the chart may have missed
+            // window resizes while its section was hidden
+            if (chartContainer.data && typeof Plotly !== 'undefined') Plotly.Plots.resize(chartContainer);
+        } else if (section === 'evaluations') {
+            if (sectionEvaluations) sectionEvaluations.classList.remove('section-hidden');
+            if (navEvaluations) navEvaluations.classList.add('active');
+            sidebarFilters.style.display = 'none';
+            // Render evaluation charts when section is shown
+            if (typeof renderEvaluationCharts === 'function') {
+                setTimeout(renderEvaluationCharts, 100);
+            }
+        } else {
+            sectionAbout.classList.remove('section-hidden');
+            navAbout.classList.add('active');
+            sidebarFilters.style.display = 'none';
+        }
+    }
+
+    if (navDashboard) navDashboard.addEventListener('click', () => switchSection('dashboard'));
+    if (navEvaluations) navEvaluations.addEventListener('click', () => switchSection('evaluations'));
+    if (navAbout) navAbout.addEventListener('click', () => switchSection('about'));
+})();
+</script>
+"""
+
+# Sidebar toggle script
+_SIDEBAR_SCRIPT = """
+<script>
+  (function() {
+  const sidebarToggle = document.getElementById('sidebar-toggle');
+  const sidebar = document.getElementById('sidebar');
+  const sidebarOverlay = document.getElementById('sidebar-overlay');
+      const mainContent = document.querySelector('main');
+  
+  function toggleSidebar() {
+        const isHidden = sidebar.classList.toggle('hidden');
+        if (window.innerWidth >= 768) {
+          if (isHidden) {
+            mainContent.classList.add('full-width');
+          } else {
+            mainContent.classList.remove('full-width');
+          }
+        } else {
+      sidebarOverlay.classList.toggle('show');
+    }
+  }
+  
+      if (sidebarToggle) sidebarToggle.addEventListener('click', toggleSidebar);
+      if (sidebarOverlay) sidebarOverlay.addEventListener('click', toggleSidebar);
+      
+  function updateSidebarState() {
+    if (window.innerWidth >= 768) {
+      sidebar.classList.remove('hidden');
+          mainContent.classList.remove('full-width');
+      if (sidebarOverlay) sidebarOverlay.classList.remove('show');
+    } else {
+      sidebar.classList.add('hidden');
+          mainContent.classList.add('full-width');
+      if (sidebarOverlay) sidebarOverlay.classList.remove('show');
+    }
+  }
+  
+  updateSidebarState();
+  // Resize fires many times per frame while dragging; apply at most once a frame
+  let resizePending = false;
+  window.addEventListener('resize', () => {
+    if (resizePending) return;
+    resizePending = true;
+    requestAnimationFrame(() => {
+      resizePending = false;
+      updateSidebarState();
+    });
+  });
+  })();
+</script>
+"""
+
+# Chatbot component and page close
+_CHATBOT = """
+    <!-- Chatbot Toggle Button -->
+    <button class="chatbot-toggle" id="chatbot-toggle" title="Get energy usage recommendations">
+        💬
+    </button>
+    
+    <!-- Chatbot Container -->
+    <div class="chatbot-container" id="chatbot-container">
+        <div class="chatbot-header" id="chatbot-header">
+            <h6>Energy Usage Assistant</h6>
+            <span id="chatbot-close" style="cursor: pointer; font-size: 1.2rem;">×</span>
+        </div>
+        <div class="chatbot-body" id="chatbot-messages">
+            <div class="chatbot-message assistant">
+                <strong>Assistant:</strong> Hi! I'm your energy usage assistant. I analyze predictions and historical data to help you save money. Ask me about the best times to use electricity, or I can automatically analyze today's data for you.
+            </div>
+        </div>
+        <div class="chatbot-input-container">
+            <input type="text" class="chatbot-input" id="chatbot-input" placeholder="Ask about energy usage..." />
+            <button class="btn btn-primary btn-sm" id="chatbot-send">Send</button>
+        </div>
+    </div>
+    </main></div></div>
     
-    tbody.innerHTML = splitData.map(d => {{
-        const year = d.year || '';
-        const month = d.month || '';
-        const day = d.day !== undefined ? d.day : '';
-        const hour = d.hour !== undefined ? d.hour : '';
+    <script>
+    // Chatbot functionality
+    (function() {
+        const chatbotToggle = document.getElementById('chatbot-toggle');
+        const chatbotContainer = document.getElementById('chatbot-container');
+        const chatbotClose = document.getElementById('chatbot-close');
+        const chatbotInput = document.getElementById('chatbot-input');
+        const chatbotSend = document.getElementById('chatbot-send');
+        const chatbotMessages = document.getElementById('chatbot-messages');
+        const granularitySelect = document.getElementById('granularity');
+        
+        function toggleChatbot() {
+            chatbotContainer.classList.toggle('open');
+            chatbotToggle.classList.toggle('hidden');
+            if (chatbotContainer.classList.contains('open')) {
+                chatbotInput.focus();
+            }
+        }
         
-        let cells = `
-            <td><span class="badge ${{d.type === 'historical' ? 'bg-secondary' : 'bg-primary'}}">${{d.type.charAt(0).toUpperCase() + d.type.slice(1)}}</span></td>
-            <td><strong>$${{d.val.toFixed(d.for === 'hourly' ? 4 : 2)}}</strong></td>
-        `;
+        chatbotToggle.addEventListener('click', toggleChatbot);
+        chatbotClose.addEventListener('click', toggleChatbot);
         
-        if (granularity === 'hourly') {{
-            cells += `
-                <td class="text-muted small">${{year}}</td>
-                <td class="text-muted small">${{month}}</td>
-                <td class="text-muted small">${{day}}</td>
-                <td class="text-muted small">${{hour}}</td>
-            `;
-        }} else if (granularity === 'daily') {{
-            cells += `
-                <td class="text-muted small">${{year}}</td>
-                <td class="text-muted small">${{month}}</td>
-                <td class="text-muted small">${{day}}</td>
-            `;
-        }} else if (granularity === 'weekly' || granularity === 'monthly') {{
-            cells += `
-                <td class="text-muted small">${{year}}</td>
-                <td class="text-muted small">${{month}}</td>
-            `;
-        }}
+        function addMessage(text, isUser = false) {
+            // Parse and insert the whole message in one step
+            chatbotMessages.insertAdjacentHTML('beforeend',
+                `<div class="chatbot-message ${isUser ? 'user' : 'assistant'}"><strong>${isUser ? 'You' : 'Assistant'}:</strong> ${text}</div>`);
+            chatbotMessages.scrollTop = chatbotMessages.scrollHeight;
+        }
         
-        return `<tr>${{cells}}</tr>`;
-    }}).join('');
-    
-    if (displayData.length === 0) {{
-        const colCount = granularity === 'hourly' ? 6 : granularity === 'daily' ? 5 : 4;
-        tbody.innerHTML = `<tr><td colspan="${{colCount}}" class="text-center text-muted py-4">No data available for this selection</td></tr>`;
-    }}
-    
-    // Update Pagination UI
-    document.getElementById('pagination-info').innerText = totalEntries > 0 
-        ? `Showing ${{startIdx + 1}} to ${{endIdx}} of ${{totalEntries}} entries`
-        : `Showing 0 to 0 of 0 entries`;
+        // The k rows that come first under `before`, in that order, found in
+        // one pass; rows tied under `before` keep their input order, matching
+        // a stable sort
+        function topK(rows, k, before) {
+            const top = [];
+            for (const row of rows) {
+                if (top.length === k && !before(row, top[k - 1])) continue;
+                let i = top.length;
+                while (i > 0 && before(row, top[i - 1])) i--;
+                top.splice(i, 0, row);
+                if (top.length > k) top.pop();
+            }
+            return top;
+        }
+        // Cheapest (first on ties) and priciest (last on ties) rows in one scan
+        function costExtremes(rows) {
+            let min = rows[0], max = rows[0];
+            for (let i = 1; i < rows.length; i++) {
+                const row = rows[i];
+                if (row.val < min.val) min = row;
+                if (row.val >= max.val) max = row;
+            }
+            return { min, max };
+        }
+        const cheaper = (a, b) => a.val < b.val;
+        // Ties go to the later row, as in the tail of an ascending stable sort
+        const pricier = (a, b) => a.val >= b.val;
         
-    const pagList = document.getElementById('pagination-list');
-    pagList.innerHTML = '';
-    
-    // Prev
-    const prevLi = document.createElement('li');
-    prevLi.className = `page-item ${{normalizedPage === 1 ? 'disabled' : ''}}`;
-    prevLi.innerHTML = `<a class="page-link" href="#" onclick="changePage(${{normalizedPage - 1}})">Previous</a>`;
-    pagList.appendChild(prevLi);
-    
-    // Pages (Show 5 around current)
-    for (let i = 1; i <= totalPages; i++) {{
-        if (totalPages > 5) {{
-            if (i > normalizedPage + 2 || i < normalizedPage - 2) continue;
-        }}
-        const li = document.createElement('li');
-        li.className = `page-item ${{i === normalizedPage ? 'active' : ''}}`;
-        li.innerHTML = `<a class="page-link" href="#" onclick="changePage(${{i}})">${{i}}</a>`;
-        pagList.appendChild(li);
-    }}
-    
-    // Next
-    const nextLi = document.createElement('li');
-    nextLi.className = `page-item ${{normalizedPage === totalPages || totalEntries === 0 ? 'disabled' : ''}}`;
-    nextLi.innerHTML = `<a class="page-link" href="#" onclick="changePage(${{normalizedPage + 1}})">Next</a>`;
-    pagList.appendChild(nextLi);
-}}
-
-function changePage(p) {{
-    if (p < 1) return;
-    tableState.currentPage = p;
-    renderTable();
-}}
-
-function handleSort(col) {{
-    if (tableState.sortCol === col) {{
-        tableState.sortDir = tableState.sortDir === 'asc' ? 'desc' : 'asc';
-    }} else {{
-        tableState.sortCol = col;
-        tableState.sortDir = 'asc';
-    }}
-    
-    // Update Header Icons
-    document.querySelectorAll('th.sortable').forEach(th => th.classList.remove('asc', 'desc'));
-    let activeTh;
-    if (col === 'val') {{
-        activeTh = document.getElementById('sort-cost');
-    }} else if (col === 'year') {{
-        activeTh = document.getElementById('col-year');
-    }} else if (col === 'month') {{
-        activeTh = document.getElementById('col-month');
-    }} else if (col === 'day') {{
-        activeTh = document.getElementById('col-day');
-    }} else if (col === 'hour') {{
-        activeTh = document.getElementById('col-hour');
-    }}
-    if (activeTh) activeTh.classList.add(tableState.sortDir);
-    
-    applyTableState();
-}}
-
-function updateChart(data, granularity, start, end) {{
-    const container = document.getElementById('energy-chart-container');
-    if (!container) return;
-    
-    // Sort all data by date to ensure proper ordering
-    const sortedData = [...data].sort((a, b) => {{
-        const dateA = new Date(a.date);
-        const dateB = new Date(b.date);
-        return dateA - dateB;
-    }});
-    
-    // For monthly data, handle duplicates: if same month exists in both historical and prediction,
-    // prefer historical over prediction
-    let processedData = sortedData;
-    if (granularity === 'monthly') {{
-        const monthMap = new Map();
-        // First pass: collect all data by month, preferring historical
-        sortedData.forEach(d => {{
-            const monthKey = d.date.substring(0, 7); // YYYY-MM
-            if (!monthMap.has(monthKey)) {{
-                // No data for this month yet, add it
-                monthMap.set(monthKey, d);
-            }} else if (d.type === 'historical' && monthMap.get(monthKey).type === 'prediction') {{
-                // Historical exists and current map has prediction, replace with historical
-                monthMap.set(monthKey, d);
-            }}
-            // If map already has historical, keep it (don't replace with prediction)
-        }});
-        processedData = Array.from(monthMap.values()).sort((a, b) => {{
-            return new Date(a.date) - new Date(b.date);
-        }});
-    }}
-    
-    const hist = processedData.filter(d => d.type === 'historical');
-    const pred = processedData.filter(d => d.type === 'prediction');
-    const traces = [];
-    
-    if (hist.length > 0) {{
-        traces.push({{
-            x: hist.map(d => d.date_display || d.date),
-            y: hist.map(d => d.val),
-            type: 'scatter',
-            mode: 'lines+markers',
-            name: 'Historical Cost',
-            line: {{ color: '#64748b', width: 2 }},
-            marker: {{ size: 6 }},
-            hovertemplate: '<b>%{{x}}</b><br>Cost: $%{{y:.2f}}<extra></extra>'
-        }});
-    }}
-    
-    if (pred.length > 0) {{
-        // For monthly, ensure smooth connection between historical and predictions
-        let connectX = pred.map(d => d.date_display || d.date);
-        let connectY = pred.map(d => d.val);
+        // Data arrays never change after load (allData and the per-granularity
+        // buckets are built once), so each array's recommendations are
+        // computed on first request and reused by later views and queries
+        const recommendationCache = new WeakMap();
         
-        if (granularity === 'monthly' && hist.length > 0 && pred.length > 0) {{
-            const lastHist = hist[hist.length - 1];
-            const firstPred = pred[0];
-            const lastHistDate = new Date(lastHist.date);
-            const firstPredDate = new Date(firstPred.date);
+        function generateRecommendations(data) {
+            if (!data || data.length === 0) {
+                return "I don't have enough data to provide recommendations. Please select a granularity with available data.";
+            }
+            if (!recommendationCache.has(data)) {
+                recommendationCache.set(data, buildRecommendations(data));
+            }
+            return recommendationCache.get(data);
+        }
+        
+        // General tips appended to every set of recommendations
+        const GENERAL_TIPS =
+            '<strong>💡 Tips:</strong><br>' +
+            '• Schedule EV charging during off-peak hours (typically late night/early morning)<br>' +
+            '• Run dishwashers and washing machines during cheaper hours<br>' +
+            '• Pre-cool your home before peak hours in summer<br>' +
+            '• Use timers for major appliances to take advantage of lower rates<br>';
+        
+        // Label formatters, built once instead of per toLocale*String call
+        const HOUR_FORMAT = new Intl.DateTimeFormat('en-US', { hour: 'numeric', hour12: true });
+        const DAY_FORMAT = new Intl.DateTimeFormat('en-US', { weekday: 'long', month: 'short', day: 'numeric' });
+        const MONTH_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'long', year: 'numeric' });
+        
+        function buildRecommendations(data) {
+            // Bucket predictions by granularity in a single pass
+            const predsByGranularity = { hourly: [], daily: [], weekly: [], monthly: [] };
+            let hasPredictions = false, hasHistorical = false;
+            for (const d of data) {
+                if (d.type === 'prediction') {
+                    hasPredictions = true;
+                    if (predsByGranularity[d.for]) predsByGranularity[d.for].push(d);
+                } else if (d.type === 'historical') {
+                    hasHistorical = true;
+                }
+            }
             
-            // Calculate month difference
-            const monthsDiff = (firstPredDate.getFullYear() - lastHistDate.getFullYear()) * 12 + 
-                              (firstPredDate.getMonth() - lastHistDate.getMonth());
+            if (!hasPredictions && !hasHistorical) {
+                return "No data available for analysis.";
+            }
             
-            // If predictions start immediately after historical (adjacent months), 
-            // add the last historical point to create a smooth transition
-            if (monthsDiff === 1) {{
-                connectX = [lastHist.date_display || lastHist.date, ...connectX];
-                connectY = [lastHist.val, ...connectY];
-            }}
-        }}
+            let html = '';
+            
+            // Analyze hourly data for best times
+            const hourlyPreds = predsByGranularity.hourly;
+            if (hourlyPreds.length > 0) {
+                // Find cheapest and most expensive hours
+                const cheapestHours = topK(hourlyPreds, 5, cheaper);
+                const expensiveHours = topK(hourlyPreds, 5, pricier);
+                
+                if (cheapestHours.length > 0) {
+                    const avgCheap = cheapestHours.reduce((sum, d) => sum + d.val, 0) / cheapestHours.length;
+                    const avgExpensive = expensiveHours.reduce((sum, d) => sum + d.val, 0) / expensiveHours.length;
+                    const savings = ((avgExpensive - avgCheap) / avgExpensive * 100).toFixed(1);
+                    
+                    const hourLabel = d => HOUR_FORMAT.format(new Date(d.date));
+                    const cheapLabels = cheapestHours.map(hourLabel).join(', ');
+                    const expensiveLabels = expensiveHours.slice(0, 3).map(hourLabel).join(', ');
+                    
+                    html += `<strong>Best Hours to Use Electricity:</strong><br>`;
+                    html += `The cheapest hours are: ${cheapLabels}<br>`;
+                    html += `Average cost: $${avgCheap.toFixed(4)}/hour<br>`;
+                    html += `<strong>Avoid these expensive hours:</strong> ${expensiveLabels} ($${avgExpensive.toFixed(4)}/hour)<br>`;
+                    html += `<span class="recommendation-badge best">Potential Savings: ${savings}%</span><br><br>`;
+                }
+            }
+            
+            // Analyze daily patterns
+            const dailyPreds = predsByGranularity.daily;
+            if (dailyPreds.length > 0) {
+                const { min: cheapestDay, max: expensiveDay } = costExtremes(dailyPreds);
+                
+                if (cheapestDay && expensiveDay) {
+                    const date1 = new Date(cheapestDay.date);
+                    const date2 = new Date(expensiveDay.date);
+                    html += `<strong>Daily Recommendations:</strong><br>`;
+                    html += `Best day: ${DAY_FORMAT.format(date1)} - $${cheapestDay.val.toFixed(2)}<br>`;
+                    html += `Most expensive day: ${DAY_FORMAT.format(date2)} - $${expensiveDay.val.toFixed(2)}<br><br>`;
+                }
+            }
+            
+            // Analyze weekly patterns
+            const weeklyPreds = predsByGranularity.weekly;
+            if (weeklyPreds.length > 0) {
+                const avgWeekly = weeklyPreds.reduce((sum, d) => sum + d.val, 0) / weeklyPreds.length;
+                html += `<strong>Weekly Outlook:</strong><br>`;
+                html += `Average weekly cost: $${avgWeekly.toFixed(2)}<br>`;
+                html += `Plan major energy-intensive tasks (laundry, EV charging) during cheaper weeks.<br><br>`;
+            }
+            
+            // Monthly insights
+            const monthlyPreds = predsByGranularity.monthly;
+            if (monthlyPreds.length > 0) {
+                html += `<strong>Monthly Insights:</strong><br>`;
+                html += `Upcoming months show ${monthlyPreds.length > 1 ? 'varying' : 'consistent'} costs.<br>`;
+                if (monthlyPreds.length > 1) {
+                    const cheapestMonth = costExtremes(monthlyPreds).min;
+                    const date = new Date(cheapestMonth.date);
+                    html += `Best month: ${MONTH_FORMAT.format(date)} - $${cheapestMonth.val.toFixed(2)}<br>`;
+                }
+            }
+            
+            return html + GENERAL_TIPS;
+        }
         
-        traces.push({{
-            x: connectX,
-            y: connectY,
-            type: 'scatter',
-            mode: 'lines+markers',
-            name: 'Predicted Cost',
-            line: {{ color: '#3b82f6', width: 3, dash: 'dash' }},
-            marker: {{ size: 8 }},
-            hovertemplate: '<b>%{{x}}</b><br>Cost: $%{{y:.2f}}<extra></extra>',
-            connectgaps: true
-        }});
-    }}
-    
-    const titleDate = start.toLocaleDateString(undefined, {{ 
-        year: 'numeric', 
-        month: granularity === 'monthly' ? undefined : 'short', 
-        day: (granularity === 'hourly' || granularity === 'daily') ? 'numeric' : undefined 
-    }});
+        // Make generateRecommendations globally accessible for recommendations container
+        window.generateRecommendations = generateRecommendations;
+        
+        // Records for the granularity selected on the dashboard; the buckets
+        // stay empty until data.json has loaded
+        function selectedGranularityData() {
+            const granularity = granularitySelect?.value || 'monthly';
+            return dataByGranularity[granularity] || [];
+        }
+        
+        // Keywords (matched anywhere in the lowercased query) that ask for an
+        // analysis, and ones that read as a greeting; each is one regex scan
+        const ANALYSIS_QUERY = /best time|cheapest|when should|analyze|recommend|suggest/;
+        const GREETING_QUERY = /hello|hi/;
+        
+        function handleChatbotQuery(query) {
+            const lowerQuery = query.toLowerCase();
+            const currentData = selectedGranularityData();
+            
+            if (ANALYSIS_QUERY.test(lowerQuery)) {
+                if (currentData.length === 0) {
+                    addMessage("Please select a granularity first to load data, then ask again.");
+                    return;
+                }
+                const recommendations = generateRecommendations(currentData);
+                addMessage(recommendations);
+            } else if (GREETING_QUERY.test(lowerQuery) || lowerQuery === '') {
+                addMessage("Hello! I can help you find the best times to use electricity based on predictions and historical data. Try asking: 'What are the best times to use electricity?' or 'Analyze today's data'");
+            } else {
+                addMessage("I can help you with energy usage recommendations. Try asking: 'What are the best times to use electricity?' or 'Analyze the current data for recommendations'");
+            }
+        }
+        
+        // Minimum gap between handled sends; a throttled query stays in the input
+        const SEND_INTERVAL_MS = 150;
+        let lastSend = -Infinity;
+        
+        chatbotSend.addEventListener('click', () => {
+            const now = performance.now();
+            if (now - lastSend < SEND_INTERVAL_MS) return;
+            const query = chatbotInput.value.trim();
+            if (query) {
+                lastSend = now;
+                addMessage(query, true);
+                chatbotInput.value = '';
+                setTimeout(() => handleChatbotQuery(query), 500);
+            }
+        });
+        
+        chatbotInput.addEventListener('keypress', (e) => {
+            if (e.key === 'Enter') {
+                chatbotSend.click();
+            }
+        });
+        
+        // Function to generate recommendations when data is available
+        window.chatbotGenerateRecommendations = function() {
+            if (chatbotContainer.classList.contains('open')) {
+                const currentData = selectedGranularityData();
+                if (currentData.length > 0) {
+                    const recommendations = generateRecommendations(currentData);
+                    addMessage(`<strong>Automatic Analysis:</strong><br>${recommendations}`);
+                }
+            }
+        };
+    })();
+    </script>
+    </body></html>"""
+
+
+def _dumps(obj) -> bytes:
+    """Serialize `obj` to compact JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _compact(src: str) -> str:
+    """Strip indentation, blank lines and whole-line // comments from an
+    embedded script. Newlines are kept so automatic semicolon insertion is
+    unaffected; none of the scripts use multi-line string literals."""
+    lines = (line.strip() for line in src.splitlines())
+    return "\n".join(line for line in lines
+                     if line and not line.startswith("//"))
+
+
+def _read_csv(path: Path, **kwargs) -> pd.DataFrame:
+    return pd.read_csv(path, **kwargs) if path.exists() else pd.DataFrame()
+
+
+def _format_evaluation_metrics(metrics: dict) -> str:
+    """Format evaluation metrics as HTML."""
+    if not metrics:
+        return ""
+
+    html_parts = []
+    for granularity, metric_data in metrics.items():
+        html_parts.append(f"""
+        <div class='card mb-3'>
+            <div class='card-header fw-semibold'>{granularity.upper()} Model Metrics</div>
+            <div class='card-body'>
+                <div class='row g-3'>
+                    <div class='col-md-3'>
+                        <div class='stat-card'>
+                            <div class='small text-muted mb-1'>Mean Absolute Error</div>
+                            <div class='h5 mb-0'>${metric_data.get('mae', 0):.4f}</div>
+                        </div>
+                    </div>
+                    <div class='col-md-3'>
+                        <div class='stat-card'>
+                            <div class='small text-muted mb-1'>Root Mean Squared Error</div>
+                            <div class='h5 mb-0'>${metric_data.get('rmse', 0):.4f}</div>
+                        </div>
+                    </div>
+                    <div class='col-md-3'>
+                        <div class='stat-card'>
+                            <div class='small text-muted mb-1'>Mean Absolute % Error</div>
+                            <div class='h5 mb-0'>{metric_data.get('mape', 0):.2f}%</div>
+                        </div>
+                    </div>
+                    <div class='col-md-3'>
+                        <div class='stat-card'>
+                            <div class='small text-muted mb-1'>R² Score</div>
+                            <div class='h5 mb-0'>{metric_data.get('r2', 0):.4f}</div>
+                        </div>
+                    </div>
+                    <div class='col-md-6'>
+                        <div class='stat-card'>
+                            <div class='small text-muted mb-1'>Mean Actual Value</div>
+                            <div class='h5 mb-0'>${metric_data.get('mean_actual', 0):.2f}</div>
+                        </div>
+                    </div>
+                    <div class='col-md-6'>
+                        <div class='stat-card'>
+                            <div class='small text-muted mb-1'>Mean Predicted Value</div>
+                            <div class='h5 mb-0'>${metric_data.get('mean_predicted', 0):.2f}</div>
+                        </div>
+                    </div>
+                    <div class='col-12'>
+                        <div class='small text-muted'>
+                            <strong>Sample Size:</strong> {metric_data.get('n_samples', 0)} predictions
+                            <br><strong>Mean Error:</strong> ${metric_data.get('mean_error', 0):.2f}
+                            <br><strong>RMSE as % of Mean:</strong> {metric_data.get('rmse_percentage', 0):.2f}%
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+        """)
+
+    return "".join(html_parts)
+
+
+def _format_evaluation_charts(data: dict) -> str:
+    """Format evaluation charts as JavaScript/HTML."""
+    if not data:
+        return ""
+
+    # Convert data to JSON for JavaScript
+    charts_data = {}
+    for granularity, records in data.items():
+        charts_data[granularity] = records
+
+    return f"""
+    <div id='evaluation-charts'>
+        <script>
+        const evaluationData = {_dumps(charts_data).decode("utf-8")};
+        
+        function renderEvaluationCharts() {{
+            const container = document.getElementById('evaluation-charts-container');
+            if (!container || !evaluationData) return;
+            
+            // Clear any existing charts to prevent duplicates
+            container.innerHTML = '';
+            
+            Object.keys(evaluationData).forEach(granularity => {{
+                const data = evaluationData[granularity];
+                if (!data || !data.date || data.date.length === 0) return;
+                
+                const chartDiv = document.createElement('div');
+                chartDiv.className = 'card mb-3';
+                chartDiv.innerHTML = `
+                    <div class='card-header fw-semibold'>${{granularity.toUpperCase()}} Predictions vs Actual</div>
+                    <div class='card-body'>
+                        <div id='eval-chart-${{granularity}}' style='height: 400px;'></div>
+                    </div>
+                `;
+                container.appendChild(chartDiv);
+                
+                // Columns arrive as parallel arrays, one per CSV field
+                const dates = data.date;
+                const predictions = data.prediction.map(parseFloat);
+                const actuals = data.actual.map(parseFloat);
+                
+                const trace1 = {{
+                    x: dates,
+                    y: actuals,
+                    type: 'scatter',
+                    mode: 'lines+markers',
+                    name: 'Actual',
+                    line: {{ color: '#10b981', width: 2 }},
+                    marker: {{ size: 6 }}
+                }};
+                
+                const trace2 = {{
+                    x: dates,
+                    y: predictions,
+                    type: 'scatter',
+                    mode: 'lines+markers',
+                    name: 'Predicted',
+                    line: {{ color: '#3b82f6', width: 2, dash: 'dash' }},
+                    marker: {{ size: 6 }}
+                }};
                 
                 const layout = {{
-        title: `${{granularity.charAt(0).toUpperCase() + granularity.slice(1)}} Spending (${{titleDate}}${{granularity !== 'hourly' ? ' context' : ''}})`,
-        xaxis: {{ title: 'Time' }},
-        yaxis: {{ title: 'Cost (USD)' }},
-        margin: {{ t: 40, b: 40, l: 60, r: 20 }},
-        height: 450,
-        legend: {{ orientation: 'h', y: -0.2 }}
-    }};
-    
-    Plotly.newPlot(container, traces, layout, {{responsive: true}});
-}}
-
-function updateNavigationButtons() {{
-    const granularity = document.getElementById('granularity')?.value || 'monthly';
-    const currentDateStr = document.getElementById('date-range').value || (fp ? fp.formatDate(fp.selectedDates[0], 'Y-m-d') : '');
-    const prevBtn = document.getElementById('chart-prev-btn');
-    const nextBtn = document.getElementById('chart-next-btn');
-    
-    if (!currentDateStr || !prevBtn || !nextBtn) {{
-        if (prevBtn) {{
-            prevBtn.disabled = true;
-            prevBtn.classList.add('disabled');
+                    xaxis: {{ title: 'Date' }},
+                    yaxis: {{ title: 'Cost (USD)' }},
+                    height: 400,
+                    legend: {{ orientation: 'h', y: -0.2 }}
+                }};
+                
+                Plotly.newPlot(`eval-chart-${{granularity}}`, [trace1, trace2], layout, {{responsive: true}});
+            }});
         }}
-        if (nextBtn) {{
-            nextBtn.disabled = true;
-            nextBtn.classList.add('disabled');
+        
+        // Render charts immediately if data exists, and when evaluations section is shown
+        if (Object.keys(evaluationData).length > 0) {{
+            // Render charts on page load if data exists, after the deferred
+            // Plotly script has run
+            document.addEventListener('DOMContentLoaded', () => {{
+                setTimeout(renderEvaluationCharts, 100);
+            }});
         }}
-        return;
-    }}
-    
-    const currentDate = new Date(currentDateStr + 'T00:00:00');
-    const sortedDates = [...validDates].sort();
-    
-    // Check if there's data for previous period
-    let hasPrevData = false;
-    if (granularity === 'hourly') {{
-        const prevDate = new Date(currentDate);
-        prevDate.setDate(currentDate.getDate() - 1);
-        const prevDateStr = prevDate.toISOString().split('T')[0];
-        hasPrevData = sortedDates.some(d => d <= prevDateStr && d < currentDateStr);
-    }} else if (granularity === 'daily') {{
-        const prevDate = new Date(currentDate);
-        prevDate.setDate(currentDate.getDate() - 7);
-        const prevDateStr = prevDate.toISOString().split('T')[0];
-        hasPrevData = sortedDates.some(d => d <= prevDateStr && d < currentDateStr);
-    }} else if (granularity === 'weekly') {{
-        const prevDate = new Date(currentDate);
-        prevDate.setMonth(currentDate.getMonth() - 1);
-        const prevDateStr = prevDate.toISOString().split('T')[0];
-        hasPrevData = sortedDates.some(d => d <= prevDateStr && d < currentDateStr);
-    }} else if (granularity === 'monthly') {{
-        const prevDate = new Date(currentDate);
-        prevDate.setFullYear(currentDate.getFullYear() - 1);
-        const prevYear = prevDate.getFullYear();
-        hasPrevData = sortedDates.some(d => {{
-            const dYear = new Date(d + 'T00:00:00').getFullYear();
-            return dYear < currentDate.getFullYear();
-        }});
-    }}
-    
-    // Check if there's data for next period
-    let hasNextData = false;
-    if (granularity === 'hourly') {{
-        const nextDate = new Date(currentDate);
-        nextDate.setDate(currentDate.getDate() + 1);
-        const nextDateStr = nextDate.toISOString().split('T')[0];
-        hasNextData = sortedDates.some(d => d >= nextDateStr && d > currentDateStr);
-    }} else if (granularity === 'daily') {{
-        const nextDate = new Date(currentDate);
-        nextDate.setDate(currentDate.getDate() + 7);
-        const nextDateStr = nextDate.toISOString().split('T')[0];
-        hasNextData = sortedDates.some(d => d >= nextDateStr && d > currentDateStr);
-    }} else if (granularity === 'weekly') {{
-        const nextDate = new Date(currentDate);
-        nextDate.setMonth(currentDate.getMonth() + 1);
-        const nextDateStr = nextDate.toISOString().split('T')[0];
-        hasNextData = sortedDates.some(d => d >= nextDateStr && d > currentDateStr);
-    }} else if (granularity === 'monthly') {{
-        const nextYear = currentDate.getFullYear() + 1;
-        hasNextData = sortedDates.some(d => {{
-            const dYear = new Date(d + 'T00:00:00').getFullYear();
-            return dYear > currentDate.getFullYear();
-        }});
-    }}
-    
-    // Update button states
-    prevBtn.disabled = !hasPrevData;
-    nextBtn.disabled = !hasNextData;
-    
-    // Add/remove disabled class for styling
-    if (hasPrevData) {{
-        prevBtn.classList.remove('disabled');
-    }} else {{
-        prevBtn.classList.add('disabled');
-    }}
-    
-    if (hasNextData) {{
-        nextBtn.classList.remove('disabled');
-    }} else {{
-        nextBtn.classList.add('disabled');
-    }}
-}}
-
-function navigateChart(direction) {{
-    const granularity = document.getElementById('granularity')?.value || 'monthly';
-    const currentDateStr = document.getElementById('date-range').value || (fp ? fp.formatDate(fp.selectedDates[0], 'Y-m-d') : '');
-    if (!currentDateStr) return;
-    
-    // Prevent navigation if button is disabled
-    const btn = direction === 'prev' ? document.getElementById('chart-prev-btn') : document.getElementById('chart-next-btn');
-    if (btn && btn.disabled) return;
-    
-    const currentDate = new Date(currentDateStr + 'T00:00:00');
-    let newDate = new Date(currentDate);
-    
-    // Navigate based on granularity
-    if (granularity === 'hourly') {{
-        newDate.setDate(currentDate.getDate() + (direction === 'next' ? 1 : -1));
-    }} else if (granularity === 'daily') {{
-        // Navigate by week
-        newDate.setDate(currentDate.getDate() + (direction === 'next' ? 7 : -7));
-    }} else if (granularity === 'weekly') {{
-        // Navigate by month
-        newDate.setMonth(currentDate.getMonth() + (direction === 'next' ? 1 : -1));
-    }} else if (granularity === 'monthly') {{
-        // Navigate by year
-        newDate.setFullYear(currentDate.getFullYear() + (direction === 'next' ? 1 : -1));
-    }}
-    
-    // Format new date and check if it's valid
-    const newDateStr = newDate.toISOString().split('T')[0];
-    
-    // Find the closest valid date
-    let targetDate = newDateStr;
-    if (!validDates.includes(newDateStr)) {{
-        // Find closest valid date
-        const sortedDates = [...validDates].sort();
-        if (direction === 'next') {{
-            targetDate = sortedDates.find(d => d > newDateStr) || sortedDates[sortedDates.length - 1];
-        }} else {{
-            const reversedDates = [...sortedDates].reverse();
-            targetDate = reversedDates.find(d => d < newDateStr) || sortedDates[0];
+        
+        // Also render when evaluations section is shown (in case section was already visible)
+        const navEvaluations = document.getElementById('nav-evaluations');
+        if (navEvaluations) {{
+            navEvaluations.addEventListener('click', () => {{
+                setTimeout(renderEvaluationCharts, 100);
+            }});
         }}
-    }}
-    
-    // Update date picker and view
-    if (fp) {{
-        fp.setDate(targetDate, false); // false = don't trigger onChange
-        updateView(); // Manually trigger updateView
-    }} else {{
-        document.getElementById('date-range').value = targetDate;
-        updateView();
-    }}
-}}
+        </script>
+    </div>
+    """
 
-// Event Listeners
-document.getElementById('table-type-filter').addEventListener('change', (e) => {{
-    tableState.typeFilter = e.target.value;
-    applyTableState();
-}});
 
-document.getElementById('table-page-size').addEventListener('change', (e) => {{
-    tableState.pageSize = parseInt(e.target.value);
-    applyTableState();
-}});
+def _add_time_parts(hourly: pd.DataFrame) -> pd.DataFrame:
+    """Add hour/dayofweek/month/year columns derived from `timestamp`."""
+    hourly = hourly[hourly["timestamp"].notna()]
+    # Derive every field from the raw datetime64 buffer instead of four
+    # separate .dt accessor passes
+    ts = hourly["timestamp"].to_numpy(dtype="datetime64[ns]")
+    hours = ts.astype("datetime64[h]").astype(np.int64)
+    months = ts.astype("datetime64[M]").astype(np.int64)
+    # Small integer dtypes keep the frame compact for the later groupbys;
+    # 1970-01-01 was a Thursday, hence the +3 for dayofweek
+    return hourly.assign(
+        hour=(hours % 24).astype(np.int8),
+        dayofweek=((hours // 24 + 3) % 7).astype(np.int8),
+        month=(months % 12 + 1).astype(np.int8),
+        year=(months // 12 + 1970).astype(np.int16),
+    )
+
+
+def _has_columns(path: Path, columns: list[str]) -> bool:
+    """Check a CSV header for the required columns without parsing rows."""
+    try:
+        header = pd.read_csv(path, nrows=0).columns
+    except pd.errors.EmptyDataError:
+        return False
+    return set(columns).issubset(header)
+
+
+def _read_hourly_price(path: Path) -> pd.DataFrame | None:
+    """Read the needed columns of one monthly price file, or None if absent."""
+    if not _has_columns(path, HOURLY_PRICE_COLUMNS):
+        return None
+    return pd.read_csv(path, usecols=HOURLY_PRICE_COLUMNS,
+                       dtype={"Estimated_Hourly_Cost_USD": "float64"})
 
-document.querySelectorAll('th.sortable').forEach(th => {{
-    th.addEventListener('click', () => handleSort(th.dataset.sort));
-}});
 
-function updatePeriodNavigation() {{
-    const granularity = document.getElementById('granularity')?.value || 'monthly';
-    const periodNav = document.getElementById('period-navigation');
-    const periodSelect = document.getElementById('period-select');
-    const periodLabel = document.getElementById('period-label');
-    
-    if (!periodNav || !periodSelect) return;
-    
-    // Filter data by granularity
-    const filteredData = allData.filter(d => d.for === granularity);
-    if (filteredData.length === 0) {{
-        periodNav.style.display = 'none';
-        return;
-    }}
-    
-    periodNav.style.display = 'block';
-    periodSelect.innerHTML = '<option value="">Select period...</option>';
-    
-    if (granularity === 'hourly') {{
-        // Show all available days
-        periodLabel.textContent = 'Navigate to Day';
-        const days = [...new Set(filteredData.map(d => d.date.split(' ')[0]))].sort().reverse();
-        days.forEach(day => {{
-            const date = new Date(day);
-            const option = document.createElement('option');
-            option.value = day;
-            option.textContent = date.toLocaleDateString('en-US', {{ weekday: 'short', year: 'numeric', month: 'short', day: 'numeric' }});
-            periodSelect.appendChild(option);
-        }});
-    }} else if (granularity === 'daily') {{
-        // Show all available weeks
-        periodLabel.textContent = 'Navigate to Week';
-        const weeks = new Map();
-        filteredData.forEach(d => {{
-            const date = new Date(d.date);
-            const weekStart = new Date(date);
-            const day = weekStart.getDay();
-            const diff = weekStart.getDate() - day + (day === 0 ? -6 : 1);
-            weekStart.setDate(diff);
-            weekStart.setHours(0, 0, 0, 0);
-            const weekEnd = new Date(weekStart);
-            weekEnd.setDate(weekStart.getDate() + 6);
-            
-            const weekKey = weekStart.toISOString().split('T')[0];
-            if (!weeks.has(weekKey)) {{
-                const weekStr = weekStart.toLocaleDateString('en-US', {{ month: 'short', day: 'numeric' }}) + 
-                              ' - ' + weekEnd.toLocaleDateString('en-US', {{ month: 'short', day: 'numeric', year: 'numeric' }});
-                weeks.set(weekKey, weekStr);
-            }}
-        }});
-        const sortedWeeks = Array.from(weeks.entries()).sort((a, b) => b[0].localeCompare(a[0]));
-        sortedWeeks.forEach(([date, label]) => {{
-            const option = document.createElement('option');
-            option.value = date;
-            option.textContent = label;
-            periodSelect.appendChild(option);
-        }});
-    }} else if (granularity === 'weekly') {{
-        // Show all available months
-        periodLabel.textContent = 'Navigate to Month';
-        const months = new Map();
-        filteredData.forEach(d => {{
-            const date = new Date(d.date);
-            const monthKey = `${{date.getFullYear()}}-${{String(date.getMonth() + 1).padStart(2, '0')}}`;
-            if (!months.has(monthKey)) {{
-                const monthStr = date.toLocaleDateString('en-US', {{ year: 'numeric', month: 'long' }});
-                months.set(monthKey, monthStr);
-            }}
-        }});
-        const sortedMonths = Array.from(months.entries()).sort((a, b) => b[0].localeCompare(a[0]));
-        sortedMonths.forEach(([date, label]) => {{
-            const option = document.createElement('option');
-            option.value = date + '-01';
-            option.textContent = label;
-            periodSelect.appendChild(option);
-        }});
-    }} else if (granularity === 'monthly') {{
-        // Show all available years
-        periodLabel.textContent = 'Navigate to Year';
-        const years = [...new Set(filteredData.map(d => {{
-            const date = new Date(d.date);
-            return date.getFullYear();
-        }}))].sort((a, b) => b - a);
-        years.forEach(year => {{
-            const option = document.createElement('option');
-            option.value = `${{year}}-01-01`;
-            option.textContent = year;
-            periodSelect.appendChild(option);
-        }});
-    }}
-}}
-
-function handlePeriodNavigation() {{
-    const periodSelect = document.getElementById('period-select');
-    if (!periodSelect || !periodSelect.value) return;
-    
-    const targetDate = periodSelect.value;
-    if (fp) {{
-        fp.setDate(targetDate, false);
-        updateView();
-    }} else {{
-        document.getElementById('date-range').value = targetDate;
-        updateView();
-    }}
-    periodSelect.value = ''; // Reset selection
-}}
+def _load_hourly_data() -> pd.DataFrame:
+    """Load hourly data from hourly_price files."""
+    price_dir = FEATURES_DIR / "hourly_price"
+    if not price_dir.is_dir():
+        return pd.DataFrame()
+    # A single directory scan; CAISO_Price_YYYY_MM names sort chronologically
+    with os.scandir(price_dir) as it:
+        names = sorted(e.name for e in it
+                       if e.name.startswith("CAISO_Price_")
+                       and e.name.endswith(".csv") and e.is_file())
+    # Last 12 months for performance
+    hourly_files = [price_dir / name for name in names[-12:]]
+    if not hourly_files:
+        return pd.DataFrame()
 
-// Chart navigation buttons
-document.getElementById('chart-prev-btn').addEventListener('click', () => navigateChart('prev'));
-document.getElementById('chart-next-btn').addEventListener('click', () => navigateChart('next'));
+    # The monthly files are independent and read_csv releases the GIL
+    # while parsing, so read them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(hourly_files))) as executor:
+        frames = [df for df in executor.map(_read_hourly_price, hourly_files)
+                  if df is not None]
+    if not frames:
+        return pd.DataFrame()
 
-// Period navigation dropdown
-document.getElementById('period-select').addEventListener('change', handlePeriodNavigation);
+    # Coerce types and derive timestamps in one pass over the combined
+    # frame instead of once per monthly file
+    hourly = pd.concat(frames, ignore_index=True)
+    hourly["Date"] = pd.to_datetime(
+        hourly["Date"], format="%Y-%m-%d", errors="coerce")
+    hourly["HE"] = pd.to_numeric(hourly["HE"], errors="coerce")
+    hourly = hourly.dropna(subset=HOURLY_PRICE_COLUMNS)
+    hourly["timestamp"] = hourly["Date"] + \
+        pd.to_timedelta(hourly["HE"] - 1, unit="h")
+    hourly = hourly[["timestamp", "Estimated_Hourly_Cost_USD", "Date", "HE"]]
+    # Dedupe on a sorted mask rather than a hash-based drop_duplicates, and
+    # gather the kept rows with a single take instead of copying the frame
+    # through set_index, sort_index, the mask and reset_index
+    ts = hourly["timestamp"].to_numpy()
+    order = np.argsort(ts, kind="stable")
+    ts = ts[order]
+    first = np.empty(len(ts), dtype=bool)
+    first[:1] = True
+    np.not_equal(ts[1:], ts[:-1], out=first[1:])
+    return hourly.take(order[first]).reset_index(drop=True)
+
+
+def _week_display(week_start: pd.Series) -> pd.Series:
+    """Format week ranges as "Jan 01-07, 2025" or "Dec 29 - Jan 04, 2025"."""
+    week_end = week_start + pd.Timedelta(days=6)
+    same_month = week_start.dt.month == week_end.dt.month
+    end = ("-" + week_end.dt.strftime("%d, %Y")).where(
+        same_month, " - " + week_end.dt.strftime("%b %d, %Y"))
+    return week_start.dt.strftime("%b %d") + end
+
+
+def _to_columns(frames: list[pd.DataFrame]) -> dict[str, list]:
+    """Combine record frames into per-field lists, None where a field is absent."""
+    if not frames:
+        return {}
+    records = pd.concat(frames, ignore_index=True)
+    # None marks an absent field, so a missing cost can't be shipped as one;
+    # drop those records rather than have the page treat val as absent
+    records = records[records["val"].notna()]
+    # Chronological order lets the client binary-search its chart window
+    records = records.sort_values("date", kind="stable", ignore_index=True)
+    columns = {}
+    for name in records.columns:
+        col = records[name]
+        if name == "val":
+            col = col.round(VAL_DECIMALS)
+        if col.isna().any():
+            col = col.astype(object).where(col.notna(), None)
+        columns[name] = col.tolist()
+    return columns
 
-// Update period navigation when granularity changes
-document.getElementById('granularity').addEventListener('change', () => {{
-    updatePeriodNavigation();
-    updateView();
-}});
 
-// Initialize flatpickr
-fp = flatpickr('#date-range', {{ 
-    mode: 'single', 
-    dateFormat: 'Y-m-d', 
-    enable: validDates,
-    defaultDate: validDates[validDates.length - 1],
-    onChange: updateView 
-}});
+def build():
+    SITE_DIR.mkdir(parents=True, exist_ok=True)
 
-// Today button handler
-function goToToday() {{
-    const granularity = document.getElementById('granularity')?.value || 'monthly';
-    const now = new Date();
-    
-    // Format today's date as YYYY-MM-DD
-    const todayStr = now.getFullYear() + '-' + 
-                     String(now.getMonth() + 1).padStart(2, '0') + '-' + 
-                     String(now.getDate()).padStart(2, '0');
-    
-    // Check if today is in valid dates, if not, use the most recent valid date
-    let targetDate = todayStr;
-    if (!validDates.includes(todayStr)) {{
-        // Find the closest valid date (prefer past dates)
-        const pastDates = validDates.filter(d => d <= todayStr);
-        targetDate = pastDates.length > 0 ? pastDates[pastDates.length - 1] : validDates[validDates.length - 1];
-    }}
-    
-    // Set the flatpickr date
-    if (fp) {{
-        fp.setDate(targetDate, false); // false = don't trigger onChange immediately
-        updateView();
-    }}
-}}
+    # The results files are independent, so parse them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        preds = executor.submit(_read_csv, RESULTS_DIR / "predictions.csv")
+        hourly_history = executor.submit(
+            _read_csv, RESULTS_DIR / "hourly_history.csv")
+        daily = executor.submit(
+            _read_csv, RESULTS_DIR / "daily_history.csv",
+            usecols=DAILY_HISTORY_COLUMNS,
+            dtype={"Estimated_Hourly_Cost_USD": "float64"},
+            parse_dates=["date"], date_format="%Y-%m-%d")
+        monthly = executor.submit(
+            _read_csv, RESULTS_DIR / "monthly_history.csv",
+            usecols=MONTHLY_HISTORY_COLUMNS,
+            dtype={"Estimated_Hourly_Cost_USD": "float64"},
+            parse_dates=["year_month_start"], date_format="%Y-%m-%d")
+    preds, hourly_history, daily, monthly = (
+        preds.result(), hourly_history.result(), daily.result(),
+        monthly.result())
+
+    # Use hourly history if available, otherwise fall back to features.
+    # The feature CSVs are only parsed when the fallback is needed.
+    hourly = None
+    if not hourly_history.empty and "Estimated_Hourly_Cost_USD" in hourly_history.columns:
+        if "timestamp" in hourly_history.columns:
+            hourly = hourly_history.copy()
+            hourly["timestamp"] = pd.to_datetime(
+                hourly["timestamp"], format="ISO8601", errors="coerce")
+        elif "Date" in hourly_history.columns and "HE" in hourly_history.columns:
+            hourly = hourly_history.copy()
+            hourly["Date"] = pd.to_datetime(
+                hourly["Date"], format="%Y-%m-%d", errors="coerce")
+            hourly["HE"] = pd.to_numeric(hourly["HE"], errors="coerce")
+            hourly = hourly.dropna(
+                subset=["Date", "HE", "Estimated_Hourly_Cost_USD"])
+            hourly["timestamp"] = hourly["Date"] + \
+                pd.to_timedelta(hourly["HE"] - 1, unit="h")
+    if hourly is None:
+        hourly = _load_hourly_data()
 
-// Attach event listener to Today button
-const todayBtn = document.getElementById('today-btn');
-if (todayBtn) {{
-    todayBtn.addEventListener('click', goToToday);
-}}
+    # Derive the time parts exactly once, whichever source was used
+    if "timestamp" in hourly.columns:
+        hourly = _add_time_parts(hourly)
 
-// Initial call
-updatePeriodNavigation();
-updateView();
+    # Process data for unified view, bucketed by granularity so the page
+    # can look a view's records up directly instead of filtering them all.
+    # Each block contributes a frame of records; the "for" field is implied
+    # by the bucket and restored by the page
+    frames_by_granularity = {
+        "hourly": [], "daily": [], "weekly": [], "monthly": []}
+
+    # 1. Historical Data
+    # Hourly
+    if not hourly.empty:
+        ts = hourly["timestamp"]
+        hourly_records = pd.DataFrame({
+            "date": ts.dt.strftime("%Y-%m-%d %H:%M:%S"),
+            "year": hourly["year"],
+            "month": MONTH_NAMES[hourly["month"].to_numpy() - 1],
+            "day": ts.dt.day,
+            "hour": hourly["hour"],
+            "val": hourly["Estimated_Hourly_Cost_USD"].astype(float),
+            "type": "historical"
+        })
+        frames_by_granularity["hourly"].append(hourly_records)
+
+    # Daily
+    if not daily.empty:
+        dt = daily["date"]
+        daily_records = pd.DataFrame({
+            "date": dt.dt.strftime("%Y-%m-%d"),
+            "year": dt.dt.year,
+            "month": MONTH_NAMES[dt.dt.month.to_numpy() - 1],
+            "day": dt.dt.day,
+            "val": daily["Estimated_Hourly_Cost_USD"].astype(float),
+            "type": "historical"
+        })
+        frames_by_granularity["daily"].append(daily_records)
+
+    # Weekly
+    if not daily.empty:
+        # Group days by their Monday; 1970-01-01 was a Thursday, so
+        # (epoch day + 3) % 7 is the number of days since Monday
+        days = daily["date"].to_numpy().astype("datetime64[D]")
+        week_keys = days - (days.astype(np.int64) + 3) % 7
+        weekly = daily["Estimated_Hourly_Cost_USD"].groupby(
+            week_keys).sum().rename_axis("week_start").reset_index()
+        week_start = weekly["week_start"]
+        weekly_records = pd.DataFrame({
+            # Keep ISO format for sorting/filtering
+            "date": week_start.dt.strftime("%Y-%m-%d"),
+            "date_display": _week_display(week_start),  # Human-readable format
+            "year": week_start.dt.year,
+            "month": MONTH_NAMES[week_start.dt.month.to_numpy() - 1],
+            "val": weekly["Estimated_Hourly_Cost_USD"].astype(float),
+            "type": "historical"
+        })
+        frames_by_granularity["weekly"].append(weekly_records)
+
+    # Monthly
+    if not monthly.empty:
+        month_date = monthly["year_month_start"]
+        monthly_records = pd.DataFrame({
+            # Keep ISO format for sorting/filtering
+            "date": month_date.dt.strftime("%Y-%m-%d"),
+            # Human-readable format, e.g. "January 2025"
+            "date_display": month_date.dt.strftime("%B %Y"),
+            "year": month_date.dt.year,
+            "month": MONTH_NAMES[month_date.dt.month.to_numpy() - 1],
+            "val": monthly["Estimated_Hourly_Cost_USD"].astype(float),
+            "type": "historical"
+        })
+        frames_by_granularity["monthly"].append(monthly_records)
+
+    # 2. Prediction Data
+    if not preds.empty:
+        preds["feature_date"] = pd.to_datetime(
+            preds["feature_date"], format="ISO8601")
+        # Classify every prediction's granularity in one vectorized pass
+        gran = preds["for"].astype(str).str.lower()
+        preds["granularity"] = np.select(
+            [gran.str.contains(key, regex=False)
+             for key in ("hour", "day", "week", "month")],
+            ["hourly", "daily", "weekly", "monthly"],
+            default="unknown")
+        # Build each granularity's records column-wise from its slice
+        for g, group in preds.groupby("granularity", sort=False):
+            d_val = group["feature_date"]
+            if g == "weekly":
+                # Calculate week range
+                d_val = d_val - pd.to_timedelta(d_val.dt.dayofweek, unit="D")
+            record = {"date": d_val.dt.strftime(
+                "%Y-%m-%d %H:%M:%S" if g == "hourly" else "%Y-%m-%d")}
+            if g == "monthly":
+                record["date_display"] = d_val.dt.strftime("%B %Y")  # "January 2025"
+            elif g == "weekly":
+                record["date_display"] = _week_display(d_val)
+            else:
+                record["date_display"] = record["date"]
+            record["year"] = d_val.dt.year
+            record["month"] = MONTH_NAMES[d_val.dt.month.to_numpy() - 1]
+            if g not in ("monthly", "weekly"):
+                record["day"] = d_val.dt.day
+            if g == "hourly":
+                record["hour"] = d_val.dt.hour
+            record["val"] = group["prediction"].astype(float)
+            record["type"] = "prediction"
+            pred_records = pd.DataFrame(record)
+            frames_by_granularity.setdefault(g, []).append(pred_records)
+
+    # Ship each bucket column-wise rather than as one dict per record, so
+    # field names are not repeated ~60k times in data.json
+    data_by_granularity = {
+        g: _to_columns(frames) for g, frames in frames_by_granularity.items()}
+
+    (SITE_DIR / "style.css").write_bytes(_PAGE_CSS.encode("utf-8"))
+    html_parts = [_PAGE_HEAD]
+
+    # Evaluations Section
+    # Dynamically find the most recent evaluation directory
+    eval_dir = None
+    eval_metrics = {}
+    eval_data = {}
+
+    # Find all evaluation directories (evaluation_YYYY)
+    if RESULTS_DIR.exists():
+        eval_dirs = [d for d in RESULTS_DIR.iterdir()
+                     if d.is_dir() and d.name.startswith("evaluation_")]
+        if eval_dirs:
+            # Sort by directory name (which includes year) and get the most recent
+            eval_dirs.sort(key=lambda x: x.name, reverse=True)
+            eval_dir = eval_dirs[0]
+            print(f"Found evaluation directory: {eval_dir.name}")
 
-// Navigation Logic
-(function() {{
-    const navDashboard = document.getElementById('nav-dashboard');
-    const navEvaluations = document.getElementById('nav-evaluations');
-    const navAbout = document.getElementById('nav-about');
-    const sectionDashboard = document.getElementById('section-dashboard');
-    const sectionEvaluations = document.getElementById('section-evaluations');
-    const sectionAbout = document.getElementById('section-about');
-    const sidebarFilters = document.getElementById('sidebar-filters');
+    if eval_dir and (eval_dir / "metrics_summary.json").exists():
+        with open(eval_dir / "metrics_summary.json", "r") as f:
+            eval_metrics = json.load(f)
 
-    function switchSection(section) {{
-        // Hide all sections
-        sectionDashboard.classList.add('section-hidden');
-        if (sectionEvaluations) sectionEvaluations.classList.add('section-hidden');
-        sectionAbout.classList.add('section-hidden');
-        
-        // Remove active from all nav items
-        navDashboard.classList.remove('active');
-        if (navEvaluations) navEvaluations.classList.remove('active');
-        navAbout.classList.remove('active');
-        
-        // Show selected section
-        if (section === 'dashboard') {{
-            sectionDashboard.classList.remove('section-hidden');
-            navDashboard.classList.add('active');
-            sidebarFilters.style.display = 'block';
-            updateView();
-        }} else if (section === 'evaluations') {{
-            if (sectionEvaluations) sectionEvaluations.classList.remove('section-hidden');
-            if (navEvaluations) navEvaluations.classList.add('active');
-            sidebarFilters.style.display = 'none';
-            // Render evaluation charts when section is shown
-            if (typeof renderEvaluationCharts === 'function') {{
-                setTimeout(renderEvaluationCharts, 100);
-            }}
-        }} else {{
-            sectionAbout.classList.remove('section-hidden');
-            navAbout.classList.add('active');
-            sidebarFilters.style.display = 'none';
-        }}
-    }}
+    # Load evaluation prediction vs actual data
+    if eval_dir:
+        for granularity in ["daily", "weekly", "monthly"]:
+            eval_file = eval_dir / f"{granularity}_predictions_vs_actual.csv"
+            if eval_file.exists():
+                df = pd.read_csv(eval_file)
+                eval_data[granularity] = df.to_dict("list")
 
-    if (navDashboard) navDashboard.addEventListener('click', () => switchSection('dashboard'));
-    if (navEvaluations) navEvaluations.addEventListener('click', () => switchSection('evaluations'));
-    if (navAbout) navAbout.addEventListener('click', () => switchSection('about'));
-    
-    updateView();
-}})();
-</script>
-""")
+    # Extract year from eval_dir name if available
+    eval_year = None
+    if eval_dir:
+        try:
+            year_part = eval_dir.name.replace("evaluation_", "")
+            eval_year = year_part
+        except:
+            pass
 
-    # Sidebar Toggle Logic
-    html_parts.append("""
-<script>
-  (function() {
-  const sidebarToggle = document.getElementById('sidebar-toggle');
-  const sidebar = document.getElementById('sidebar');
-  const sidebarOverlay = document.getElementById('sidebar-overlay');
-      const mainContent = document.querySelector('main');
-  
-  function toggleSidebar() {
-        const isHidden = sidebar.classList.toggle('hidden');
-        if (window.innerWidth >= 768) {
-          if (isHidden) {
-            mainContent.classList.add('full-width');
-          } else {
-            mainContent.classList.remove('full-width');
-          }
-        } else {
-      sidebarOverlay.classList.toggle('show');
-    }
-  }
-  
-      if (sidebarToggle) sidebarToggle.addEventListener('click', toggleSidebar);
-      if (sidebarOverlay) sidebarOverlay.addEventListener('click', toggleSidebar);
-      
-  function updateSidebarState() {
-    if (window.innerWidth >= 768) {
-      sidebar.classList.remove('hidden');
-          mainContent.classList.remove('full-width');
-      if (sidebarOverlay) sidebarOverlay.classList.remove('show');
-    } else {
-      sidebar.classList.add('hidden');
-          mainContent.classList.add('full-width');
-      if (sidebarOverlay) sidebarOverlay.classList.remove('show');
-    }
-  }
-  
-  updateSidebarState();
-  window.addEventListener('resize', updateSidebarState);
-  })();
-</script>
-""")
+    # Build header and description based on whether evaluation exists
+    if eval_year:
+        header_text = f"Model Performance Evaluation ({eval_year} Predictions)"
+        description_text = f"This evaluation compares model predictions against actual data for {eval_year}. Models were trained on historical data up to the start of {eval_year} and used to predict {eval_year} values."
+    else:
+        header_text = "Model Performance Evaluation"
+        description_text = "This evaluation compares model predictions against actual data for the last complete year of available data. Models are trained on historical data up to the start of the evaluation year and used to predict values for that year."
 
-    # Chatbot component
-    html_parts.append("""
-    <!-- Chatbot Toggle Button -->
-    <button class="chatbot-toggle" id="chatbot-toggle" title="Get energy usage recommendations">
-        💬
-    </button>
-    
-    <!-- Chatbot Container -->
-    <div class="chatbot-container" id="chatbot-container">
-        <div class="chatbot-header" id="chatbot-header">
-            <h6>Energy Usage Assistant</h6>
-            <span id="chatbot-close" style="cursor: pointer; font-size: 1.2rem;">×</span>
-        </div>
-        <div class="chatbot-body" id="chatbot-messages">
-            <div class="chatbot-message assistant">
-                <strong>Assistant:</strong> Hi! I'm your energy usage assistant. I analyze predictions and historical data to help you save money. Ask me about the best times to use electricity, or I can automatically analyze today's data for you.
+    html_parts.append(f"""
+<div id='section-evaluations' class='section-hidden'>
+    <div class='card mb-3'>
+        <div class='card-header fw-semibold text-primary'>{header_text}</div>
+        <div class='card-body'>
+            <p class='text-muted mb-4'>{description_text}</p>
+            
+            <div id='evaluation-metrics-container'>
+                {_format_evaluation_metrics(eval_metrics) if eval_metrics else '<p class="text-muted">Evaluation results not yet available. Run <code>python model/evaluate.py</code> to generate evaluation metrics.</p>'}
+            </div>
+            
+            <div id='evaluation-charts-container' class='mt-4'>
+                {_format_evaluation_charts(eval_data) if eval_data else ''}
             </div>
-        </div>
-        <div class="chatbot-input-container">
-            <input type="text" class="chatbot-input" id="chatbot-input" placeholder="Ask about energy usage..." />
-            <button class="btn btn-primary btn-sm" id="chatbot-send">Send</button>
         </div>
     </div>
-    </main></div></div>
-    
-    <script>
-    // Chatbot functionality
-    (function() {
-        const chatbotToggle = document.getElementById('chatbot-toggle');
-        const chatbotContainer = document.getElementById('chatbot-container');
-        const chatbotClose = document.getElementById('chatbot-close');
-        const chatbotInput = document.getElementById('chatbot-input');
-        const chatbotSend = document.getElementById('chatbot-send');
-        const chatbotMessages = document.getElementById('chatbot-messages');
-        
-        function toggleChatbot() {
-            chatbotContainer.classList.toggle('open');
-            chatbotToggle.classList.toggle('hidden');
-            if (chatbotContainer.classList.contains('open')) {
-                chatbotInput.focus();
-            }
-        }
-        
-        chatbotToggle.addEventListener('click', toggleChatbot);
-        chatbotClose.addEventListener('click', toggleChatbot);
-        
-        function addMessage(text, isUser = false) {
-            const messageDiv = document.createElement('div');
-            messageDiv.className = `chatbot-message ${isUser ? 'user' : 'assistant'}`;
-            messageDiv.innerHTML = `<strong>${isUser ? 'You' : 'Assistant'}:</strong> ${text}`;
-            chatbotMessages.appendChild(messageDiv);
-            chatbotMessages.scrollTop = chatbotMessages.scrollHeight;
-        }
-        
-        function generateRecommendations(data) {
-            if (!data || data.length === 0) {
-                return "I don't have enough data to provide recommendations. Please select a granularity with available data.";
-            }
-            
-            const predictions = data.filter(d => d.type === 'prediction');
-            const historical = data.filter(d => d.type === 'historical');
-            
-            if (predictions.length === 0 && historical.length === 0) {
-                return "No data available for analysis.";
-            }
-            
-            let recommendations = [];
-            
-            // Analyze hourly data for best times
-            const hourlyData = data.filter(d => d.for === 'hourly');
-            if (hourlyData.length > 0) {
-                const hourlyPreds = hourlyData.filter(d => d.type === 'prediction');
-                if (hourlyPreds.length > 0) {
-                    // Find cheapest and most expensive hours
-                    const sortedByCost = [...hourlyPreds].sort((a, b) => a.val - b.val);
-                    const cheapestHours = sortedByCost.slice(0, 5);
-                    const expensiveHours = sortedByCost.slice(-5).reverse();
-                    
-                    if (cheapestHours.length > 0) {
-                        const avgCheap = cheapestHours.reduce((sum, d) => sum + d.val, 0) / cheapestHours.length;
-                        const avgExpensive = expensiveHours.reduce((sum, d) => sum + d.val, 0) / expensiveHours.length;
-                        const savings = ((avgExpensive - avgCheap) / avgExpensive * 100).toFixed(1);
-                        
-                        recommendations.push(`<strong>Best Hours to Use Electricity:</strong><br>`);
-                        recommendations.push(`The cheapest hours are: ${cheapestHours.map(d => {
-                            const date = new Date(d.date);
-                            return date.toLocaleTimeString('en-US', { hour: 'numeric', hour12: true });
-                        }).join(', ')}<br>`);
-                        recommendations.push(`Average cost: $${avgCheap.toFixed(4)}/hour<br>`);
-                        recommendations.push(`<strong>Avoid these expensive hours:</strong> ${expensiveHours.slice(0, 3).map(d => {
-                            const date = new Date(d.date);
-                            return date.toLocaleTimeString('en-US', { hour: 'numeric', hour12: true });
-                        }).join(', ')} ($${avgExpensive.toFixed(4)}/hour)<br>`);
-                        recommendations.push(`<span class="recommendation-badge best">Potential Savings: ${savings}%</span><br><br>`);
-                    }
-                }
-            }
-            
-            // Analyze daily patterns
-            const dailyData = data.filter(d => d.for === 'daily');
-            if (dailyData.length > 0) {
-                const dailyPreds = dailyData.filter(d => d.type === 'prediction');
-                if (dailyPreds.length > 0) {
-                    const sortedDaily = [...dailyPreds].sort((a, b) => a.val - b.val);
-                    const cheapestDay = sortedDaily[0];
-                    const expensiveDay = sortedDaily[sortedDaily.length - 1];
-                    
-                    if (cheapestDay && expensiveDay) {
-                        const date1 = new Date(cheapestDay.date);
-                        const date2 = new Date(expensiveDay.date);
-                        recommendations.push(`<strong>Daily Recommendations:</strong><br>`);
-                        recommendations.push(`Best day: ${date1.toLocaleDateString('en-US', { weekday: 'long', month: 'short', day: 'numeric' })} - $${cheapestDay.val.toFixed(2)}<br>`);
-                        recommendations.push(`Most expensive day: ${date2.toLocaleDateString('en-US', { weekday: 'long', month: 'short', day: 'numeric' })} - $${expensiveDay.val.toFixed(2)}<br><br>`);
-                    }
-                }
-            }
-            
-            // Analyze weekly patterns
-            const weeklyData = data.filter(d => d.for === 'weekly');
-            if (weeklyData.length > 0) {
-                const weeklyPreds = weeklyData.filter(d => d.type === 'prediction');
-                if (weeklyPreds.length > 0) {
-                    const avgWeekly = weeklyPreds.reduce((sum, d) => sum + d.val, 0) / weeklyPreds.length;
-                    recommendations.push(`<strong>Weekly Outlook:</strong><br>`);
-                    recommendations.push(`Average weekly cost: $${avgWeekly.toFixed(2)}<br>`);
-                    recommendations.push(`Plan major energy-intensive tasks (laundry, EV charging) during cheaper weeks.<br><br>`);
-                }
-            }
-            
-            // Monthly insights
-            const monthlyData = data.filter(d => d.for === 'monthly');
-            if (monthlyData.length > 0) {
-                const monthlyPreds = monthlyData.filter(d => d.type === 'prediction');
-                if (monthlyPreds.length > 0) {
-                    const sortedMonthly = [...monthlyPreds].sort((a, b) => a.val - b.val);
-                    recommendations.push(`<strong>Monthly Insights:</strong><br>`);
-                    recommendations.push(`Upcoming months show ${sortedMonthly.length > 1 ? 'varying' : 'consistent'} costs.<br>`);
-                    if (sortedMonthly.length > 1) {
-                        const cheapestMonth = sortedMonthly[0];
-                        const date = new Date(cheapestMonth.date);
-                        recommendations.push(`Best month: ${date.toLocaleDateString('en-US', { month: 'long', year: 'numeric' })} - $${cheapestMonth.val.toFixed(2)}<br>`);
-                    }
-                }
-            }
-            
-            // General tips
-            recommendations.push(`<strong>💡 Tips:</strong><br>`);
-            recommendations.push(`• Schedule EV charging during off-peak hours (typically late night/early morning)<br>`);
-            recommendations.push(`• Run dishwashers and washing machines during cheaper hours<br>`);
-            recommendations.push(`• Pre-cool your home before peak hours in summer<br>`);
-            recommendations.push(`• Use timers for major appliances to take advantage of lower rates<br>`);
-            
-            return recommendations.join('');
-        }
-        
-        // Make generateRecommendations globally accessible for recommendations container
-        window.generateRecommendations = generateRecommendations;
-        
-        function handleChatbotQuery(query) {
-            const lowerQuery = query.toLowerCase();
-            
-            // Get current data - use allData if available, otherwise try dataCache
-            const granularity = document.getElementById('granularity')?.value || 'monthly';
-            let currentData = [];
-            if (typeof allData !== 'undefined' && allData.length > 0) {
-                currentData = allData.filter(d => d.for === granularity);
-            } else if (typeof dataCache !== 'undefined' && dataCache[granularity]) {
-                currentData = dataCache[granularity];
-            }
-            
-            if (lowerQuery.includes('best time') || lowerQuery.includes('cheapest') || lowerQuery.includes('when should')) {
-                if (currentData.length === 0) {
-                    addMessage("Please select a granularity first to load data, then ask again.");
-                    return;
-                }
-                const recommendations = generateRecommendations(currentData);
-                addMessage(recommendations);
-            } else if (lowerQuery.includes('analyze') || lowerQuery.includes('recommend') || lowerQuery.includes('suggest')) {
-                if (currentData.length === 0) {
-                    addMessage("Please select a granularity first to load data, then ask again.");
-                    return;
-                }
-                const recommendations = generateRecommendations(currentData);
-                addMessage(recommendations);
-            } else if (lowerQuery.includes('hello') || lowerQuery.includes('hi') || lowerQuery === '') {
-                addMessage("Hello! I can help you find the best times to use electricity based on predictions and historical data. Try asking: 'What are the best times to use electricity?' or 'Analyze today's data'");
-            } else {
-                addMessage("I can help you with energy usage recommendations. Try asking: 'What are the best times to use electricity?' or 'Analyze the current data for recommendations'");
-            }
-        }
-        
-        chatbotSend.addEventListener('click', () => {
-            const query = chatbotInput.value.trim();
-            if (query) {
-                addMessage(query, true);
-                chatbotInput.value = '';
-                setTimeout(() => handleChatbotQuery(query), 500);
-            }
-        });
-        
-        chatbotInput.addEventListener('keypress', (e) => {
-            if (e.key === 'Enter') {
-                chatbotSend.click();
-            }
-        });
-        
-        // Function to generate recommendations when data is available
-        window.chatbotGenerateRecommendations = function() {
-            if (chatbotContainer.classList.contains('open')) {
-                const granularity = document.getElementById('granularity')?.value || 'monthly';
-                let currentData = [];
-                if (typeof allData !== 'undefined' && allData.length > 0) {
-                    currentData = allData.filter(d => d.for === granularity);
-                } else if (typeof dataCache !== 'undefined' && dataCache[granularity]) {
-                    currentData = dataCache[granularity];
-                }
-                if (currentData.length > 0) {
-                    const recommendations = generateRecommendations(currentData);
-                    addMessage(`<strong>Automatic Analysis:</strong><br>${recommendations}`);
-                }
-            }
-        };
-    })();
-    </script>
-    </body></html>""")
+</div>
+""")
+
+    html_parts.append(_ABOUT_SECTION)
+
+    # Extract valid dates (YYYY-MM-DD) for flatpickr enable list from the
+    # records actually shipped
+    all_valid_dates = sorted({
+        date[:10] for columns in data_by_granularity.values()
+        for date in columns.get("date", ())})
+
+    # The records are written to a separate data.json the page fetches, so the
+    # HTML stays small and the browser parses the data off the critical path.
+    # The content hash in the URL keeps cached copies in step with the page.
+    data_bytes = _dumps({"dataByGranularity": data_by_granularity,
+                         "validDates": all_valid_dates})
+    (SITE_DIR / "data.json").write_bytes(data_bytes)
+    data_url = f"data.json?v={hashlib.md5(data_bytes).hexdigest()[:12]}"
+
+    # Unified Dashboard Script (Historical + Predictions)
+    html_parts.append(
+        f"<script>\nconst DATA_URL = {json.dumps(data_url)};\n</script>")
+    html_parts.append(_compact(_DASHBOARD_SCRIPT))
+
+    html_parts.append(_compact(_SIDEBAR_SCRIPT))
+    html_parts.append(_compact(_CHATBOT))
     out_path = SITE_DIR / "index.html"
-    out_path.write_text("\n".join(html_parts), encoding="utf-8")
+    # Write part by part instead of materializing the joined page as both
+    # a str and its UTF-8 encoding
+    with open(out_path, "wb") as f:
+        for i, part in enumerate(html_parts):
+            if i:
+                f.write(b"\n")
+            f.write(part.encode("utf-8"))
     return out_path
 
 